@@ -1,12 +1,17 @@
-use std::sync::{Arc, RwLock};
+use std::sync::{Arc, Mutex, RwLock};
 
 use pytest_linter::config::Config;
+use pytest_linter::engine::LintEngine;
 use tower_lsp::lsp_types::*;
 use tower_lsp::Client;
 
 struct Backend {
     client: Client,
-    config: Arc<RwLock<Config>>,
+    /// Engine reused across document events; rebuilt only when the config changes.
+    engine: Arc<RwLock<Arc<LintEngine>>>,
+    /// Single-slot cache of the last linted document, so re-sent identical
+    /// content is not linted again. Bounded to one entry by construction.
+    last_result: Arc<Mutex<Option<(Url, String, Vec<Diagnostic>)>>>,
 }
 
 #[tower_lsp::async_trait]
@@ -30,8 +35,13 @@ impl tower_lsp::LanguageServer for Backend {
 
         if let Some(ref root) = workspace_root {
             if let Ok(cfg) = Config::discover(root) {
-                if let Ok(mut guard) = self.config.write() {
-                    *guard = cfg;
+                if let Ok(engine) = LintEngine::new(cfg) {
+                    if let Ok(mut guard) = self.engine.write() {
+                        *guard = Arc::new(engine);
+                    }
+                    if let Ok(mut last) = self.last_result.lock() {
+                        *last = None;
+                    }
                 }
             }
         }
@@ -65,8 +75,7 @@ impl tower_lsp::LanguageServer for Backend {
     async fn did_open(&self, params: DidOpenTextDocumentParams) {
         let uri = params.text_document.uri;
         let text = params.text_document.text;
-        let config = self.config.read().unwrap().clone();
-        let diagnostics = Self::lint_document(&uri, &text, &config);
+        let diagnostics = self.diagnostics_for(&uri, &text);
         self.client
             .publish_diagnostics(uri, diagnostics, None)
             .await;
@@ -79,8 +88,7 @@ impl tower_lsp::LanguageServer for Backend {
             .last()
             .map(|c| c.text.clone())
             .unwrap_or_default();
-        let config = self.config.read().unwrap().clone();
-        let diagnostics = Self::lint_document(&uri, &text, &config);
+        let diagnostics = self.diagnostics_for(&uri, &text);
         self.client
             .publish_diagnostics(uri, diagnostics, None)
             .await;
@@ -88,16 +96,33 @@ impl tower_lsp::LanguageServer for Backend {
 }
 
 impl Backend {
-    fn lint_document(uri: &Url, text: &str, config: &Config) -> Vec<Diagnostic> {
+    fn diagnostics_for(&self, uri: &Url, text: &str) -> Vec<Diagnostic> {
+        if let Ok(last) = self.last_result.lock() {
+            if let Some((last_uri, last_text, diagnostics)) = last.as_ref() {
+                if last_uri == uri && last_text == text {
+                    return diagnostics.clone();
+                }
+            }
+        }
+
+        let engine = self.engine.read().unwrap().clone();
+        let diagnostics = Self::lint_document(uri, text, &engine);
+        if let Ok(mut last) = self.last_result.lock() {
+            *last = Some((uri.clone(), text.to_string(), diagnostics.clone()));
+        }
+        diagnostics
+    }
+
+    fn lint_document(uri: &Url, text: &str, engine: &LintEngine) -> Vec<Diagnostic> {
         let file_path = match uri.to_file_path() {
             Ok(p) => p,
             Err(_) => return vec![],
         };
 
-        let engine = match pytest_linter::engine::LintEngine::new(config.clone()) {
-            Ok(e) => e,
-            Err(_) => return vec![],
-        };
+        // Only pytest modules are linted; skip parsing every other Python file.
+        if !pytest_linter::engine::is_py_test_file(&file_path) {
+            return vec![];
+        }
 
         let violations = match engine.lint_source(text, &file_path) {
             Ok(v) => v,
@@ -135,7 +160,10 @@ impl Backend {
 async fn main() {
     let (service, socket) = tower_lsp::LspService::new(|client| Backend {
         client,
-        config: Arc::new(RwLock::new(Config::default())),
+        engine: Arc::new(RwLock::new(Arc::new(
+            LintEngine::new(Config::default()).expect("default config is valid"),
+        ))),
+        last_result: Arc::new(Mutex::new(None)),
     });
 
     tower_lsp::Server::new(tokio::io::stdin(), tokio::io::stdout(), socket)
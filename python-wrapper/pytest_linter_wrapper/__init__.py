@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import hashlib
 import json
 import os
@@ -5,11 +7,13 @@ import platform
 import stat
 import subprocess
 import sys
-import urllib.request
 from pathlib import Path
 
+__all__ = ("VERSION", "VERSION_INFO", "install_binary", "main")
+
 REPO = "Jonathangadeaharder/pytest-linter"
-VERSION = "0.1.0"
+VERSION_INFO = (0, 1, 0)
+VERSION = ".".join(map(str, VERSION_INFO))
 BIN_NAME = "pytest-linter"
 
 
@@ -55,11 +59,15 @@ def _get_bin_dir() -> Path:
 
 
 def _download(url: str, dest: Path) -> None:
+    import urllib.request
+
     print(f"Downloading {url}")
     urllib.request.urlretrieve(url, dest)
 
 
 def _verify_checksum(filepath: Path, checksum_url: str) -> None:
+    import urllib.request
+
     try:
         checksum_data = urllib.request.urlopen(checksum_url).read().decode().strip()
     except Exception as exc:
@@ -0,0 +1,223 @@
+//! On-disk cache of parsed `conftest.py` modules, keyed by file metadata.
+//!
+//! Fixture-heavy `conftest.py` files change far less often than the tests
+//! that use them, so a warm run can reuse their `ParsedModule` after a single
+//! `stat` instead of re-parsing them.
+
+use crate::models::ParsedModule;
+use anyhow::Result;
+use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::time::UNIX_EPOCH;
+
+/// Parsed facts can change between releases, so a cache written by another
+/// version is discarded wholesale.
+const CACHE_VERSION: &str = env!("CARGO_PKG_VERSION");
+
+/// Layout of the cached `ParsedModule`s. Bump whenever the parser changes
+/// what it extracts, so caches written by an older build at the same
+/// package version are discarded too.
+const CACHE_FORMAT: u32 = 1;
+
+/// Modification time (nanoseconds since the epoch) and size of a file. A
+/// cached module is reused only while both still match.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub struct FileStamp {
+    modified_ns: u128,
+    len: u64,
+}
+
+impl FileStamp {
+    /// Read the stamp of `path`, or `None` if its metadata is unavailable.
+    #[must_use]
+    pub fn of(path: &Path) -> Option<Self> {
+        let meta = std::fs::metadata(path).ok()?;
+        let modified_ns = meta
+            .modified()
+            .ok()?
+            .duration_since(UNIX_EPOCH)
+            .ok()?
+            .as_nanos();
+        Some(Self {
+            modified_ns,
+            len: meta.len(),
+        })
+    }
+}
+
+#[derive(Serialize, Deserialize)]
+struct CacheEntry {
+    stamp: FileStamp,
+    module: ParsedModule,
+}
+
+#[derive(Serialize, Deserialize)]
+struct CacheFile {
+    version: String,
+    format: u32,
+    entries: HashMap<PathBuf, CacheEntry>,
+}
+
+/// Parsed-module cache backed by a single JSON file.
+pub struct ParseCache {
+    path: PathBuf,
+    file: CacheFile,
+    dirty: bool,
+}
+
+impl ParseCache {
+    /// Load the cache stored at `path`. A missing, unreadable or outdated
+    /// cache file yields an empty cache rather than an error.
+    #[must_use]
+    pub fn load(path: &Path) -> Self {
+        let file = std::fs::read(path)
+            .ok()
+            .and_then(|bytes| serde_json::from_slice::<CacheFile>(&bytes).ok())
+            .filter(|file| file.version == CACHE_VERSION && file.format == CACHE_FORMAT)
+            .unwrap_or_else(|| CacheFile {
+                version: CACHE_VERSION.to_string(),
+                format: CACHE_FORMAT,
+                entries: HashMap::new(),
+            });
+        Self {
+            path: path.to_path_buf(),
+            file,
+            dirty: false,
+        }
+    }
+
+    /// Whether parses of `path` are kept in the cache.
+    #[must_use]
+    pub fn is_cacheable(path: &Path) -> bool {
+        path.file_name().is_some_and(|n| n == "conftest.py")
+    }
+
+    /// Return the cached module for `path` if the file is unchanged since it
+    /// was stored.
+    #[must_use]
+    pub fn get(&self, path: &Path) -> Option<ParsedModule> {
+        let entry = self.file.entries.get(path)?;
+        (FileStamp::of(path)? == entry.stamp).then(|| entry.module.clone())
+    }
+
+    /// Record `module`, parsed from a file whose stamp was `stamp` when it
+    /// was read.
+    pub fn insert(&mut self, module: &ParsedModule, stamp: FileStamp) {
+        self.file.entries.insert(
+            module.file_path.clone(),
+            CacheEntry {
+                stamp,
+                module: module.clone(),
+            },
+        );
+        self.dirty = true;
+    }
+
+    /// Write the cache back to disk if anything changed, dropping entries
+    /// whose files no longer exist. The file is replaced atomically so an
+    /// interrupted run never leaves a truncated cache behind.
+    #[allow(clippy::missing_errors_doc)]
+    pub fn save(&mut self) -> Result<()> {
+        let entries = &mut self.file.entries;
+        let before = entries.len();
+        entries.retain(|path, _| path.exists());
+        if !self.dirty && entries.len() == before {
+            return Ok(());
+        }
+        let json = serde_json::to_vec(&self.file)?;
+        let mut tmp = self.path.clone().into_os_string();
+        tmp.push(".tmp");
+        std::fs::write(&tmp, json)?;
+        std::fs::rename(&tmp, &self.path)?;
+        self.dirty = false;
+        Ok(())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn module_at(path: &Path) -> ParsedModule {
+        ParsedModule {
+            file_path: path.to_path_buf(),
+            source: "import pytest\n".to_string(),
+            imports: vec!["import pytest".to_string()],
+            test_functions: vec![],
+            fixtures: vec![],
+        }
+    }
+
+    #[test]
+    fn test_only_conftest_is_cacheable() {
+        assert!(ParseCache::is_cacheable(Path::new("tests/conftest.py")));
+        assert!(!ParseCache::is_cacheable(Path::new("tests/test_api.py")));
+    }
+
+    #[test]
+    fn test_cache_round_trips_unchanged_file() {
+        let dir = tempfile::tempdir().unwrap();
+        let source = dir.path().join("conftest.py");
+        std::fs::write(&source, "import pytest\n").unwrap();
+        let cache_path = dir.path().join("cache.json");
+
+        let mut cache = ParseCache::load(&cache_path);
+        assert!(cache.get(&source).is_none());
+        cache.insert(&module_at(&source), FileStamp::of(&source).unwrap());
+        cache.save().unwrap();
+
+        let reloaded = ParseCache::load(&cache_path);
+        let module = reloaded.get(&source).unwrap();
+        assert_eq!(module.imports, vec!["import pytest".to_string()]);
+    }
+
+    #[test]
+    fn test_cache_misses_after_file_changes() {
+        let dir = tempfile::tempdir().unwrap();
+        let source = dir.path().join("conftest.py");
+        std::fs::write(&source, "import pytest\n").unwrap();
+        let mut cache = ParseCache::load(&dir.path().join("cache.json"));
+        cache.insert(&module_at(&source), FileStamp::of(&source).unwrap());
+
+        std::fs::write(&source, "import pytest\nimport os\n").unwrap();
+        assert!(cache.get(&source).is_none());
+    }
+
+    #[test]
+    fn test_cache_from_other_version_is_discarded() {
+        let dir = tempfile::tempdir().unwrap();
+        let source = dir.path().join("conftest.py");
+        std::fs::write(&source, "import pytest\n").unwrap();
+        let cache_path = dir.path().join("cache.json");
+        let mut cache = ParseCache::load(&cache_path);
+        cache.insert(&module_at(&source), FileStamp::of(&source).unwrap());
+        cache.save().unwrap();
+
+        let written = std::fs::read_to_string(&cache_path).unwrap();
+        let stale = written.replacen(CACHE_VERSION, "0.0.0-old", 1);
+        std::fs::write(&cache_path, stale).unwrap();
+        assert!(ParseCache::load(&cache_path).get(&source).is_none());
+    }
+
+    #[test]
+    fn test_cache_from_other_format_is_discarded() {
+        let dir = tempfile::tempdir().unwrap();
+        let source = dir.path().join("conftest.py");
+        std::fs::write(&source, "import pytest\n").unwrap();
+        let cache_path = dir.path().join("cache.json");
+        let mut cache = ParseCache::load(&cache_path);
+        cache.insert(&module_at(&source), FileStamp::of(&source).unwrap());
+        cache.save().unwrap();
+
+        let written = std::fs::read_to_string(&cache_path).unwrap();
+        let stale = written.replacen(
+            &format!("\"format\":{CACHE_FORMAT}"),
+            &format!("\"format\":{}", CACHE_FORMAT + 1),
+            1,
+        );
+        assert_ne!(stale, written);
+        std::fs::write(&cache_path, stale).unwrap();
+        assert!(ParseCache::load(&cache_path).get(&source).is_none());
+    }
+}
@@ -1,5 +1,6 @@
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
 
 use anyhow::{Context, Result};
 use serde::Deserialize;
@@ -24,6 +25,23 @@ pub struct OverrideConfig {
     pub rules: HashMap<String, RuleConfig>,
     #[serde(skip)]
     pub base_dir: Option<PathBuf>,
+    /// `path` compiled on first use, so it isn't re-parsed for every file.
+    #[serde(skip)]
+    compiled: OnceLock<Result<glob::Pattern, String>>,
+}
+
+impl OverrideConfig {
+    fn pattern(&self) -> Result<&glob::Pattern> {
+        self.compiled
+            .get_or_init(|| glob::Pattern::new(&self.path).map_err(|e| e.to_string()))
+            .as_ref()
+            .map_err(|e| {
+                anyhow::anyhow!(
+                    "invalid glob pattern '{}' in override configuration: {e}",
+                    self.path
+                )
+            })
+    }
 }
 
 /// TOML section [tool.pytest-linter] in a pyproject.toml, or the top-level
@@ -63,6 +81,8 @@ pub struct Config {
     pub config_dir: Option<PathBuf>,
     /// Directory names to exclude during file discovery (in addition to built-in defaults)
     pub excludes: Vec<String>,
+    /// Optional path of the on-disk cache of parsed conftest.py files
+    pub cache: Option<PathBuf>,
 }
 
 impl Default for Config {
@@ -84,6 +104,7 @@ impl Default for Config {
             overrides: vec![],
             config_dir: None,
             excludes: vec![],
+            cache: None,
         }
     }
 }
@@ -335,6 +356,10 @@ impl Config {
 
         self.excludes.extend(other.excludes);
 
+        if other.cache.is_some() {
+            self.cache = other.cache;
+        }
+
         self
     }
 
@@ -357,13 +382,7 @@ impl Config {
             let relative_path = override_base
                 .and_then(|dir| file_path.strip_prefix(dir).ok())
                 .unwrap_or(relative_path);
-            let pattern = glob::Pattern::new(&override_cfg.path).with_context(|| {
-                format!(
-                    "invalid glob pattern '{}' in override configuration",
-                    override_cfg.path
-                )
-            })?;
-            if pattern.matches_path(relative_path) {
+            if override_cfg.pattern()?.matches_path(relative_path) {
                 for (rule_id, rule_config) in &override_cfg.rules {
                     effective
                         .entry(rule_id.clone())
@@ -738,6 +757,25 @@ rules = { PYTEST-FLK-001 = { enabled = false } }
         assert_eq!(effective.get("PYTEST-FLK-001").unwrap().enabled, None);
     }
 
+    #[test]
+    fn test_effective_rules_invalid_glob_errors_every_time() {
+        let dir = tempfile::tempdir().unwrap();
+        let toml_content = r#"
+[[overrides]]
+path = "tests/[unclosed"
+rules = { PYTEST-FLK-001 = { enabled = false } }
+"#;
+        std::fs::write(dir.path().join("pytest-linter.toml"), toml_content).unwrap();
+
+        let cfg = Config::from_standalone(dir.path()).unwrap().unwrap();
+
+        let file_path = dir.path().join("tests/test_bar.py");
+        let first = cfg.effective_rules_for_file(&file_path).unwrap_err();
+        assert!(first.to_string().contains("invalid glob pattern"));
+        // The failed compile is cached, not forgotten.
+        assert!(cfg.effective_rules_for_file(&file_path).is_err());
+    }
+
     #[test]
     fn test_walk_up_finds_config() {
         let dir = tempfile::tempdir().unwrap();
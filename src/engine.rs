@@ -1,6 +1,7 @@
 //! Core linting engine: file discovery, parallel parsing, rule execution, and output formatting.
 
-use crate::config::Config;
+use crate::cache::{FileStamp, ParseCache};
+use crate::config::{Config, RuleConfig};
 use crate::models::{Category, Fixture, FixtureScope, ParsedModule, Severity, Violation};
 use crate::rules::{Rule, RuleContext};
 use anyhow::Result;
@@ -8,7 +9,7 @@ use colored::Colorize;
 use rayon::prelude::*;
 use std::collections::{HashMap, HashSet};
 use std::hash::BuildHasher;
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
 use walkdir::WalkDir;
 
@@ -17,9 +18,13 @@ use walkdir::WalkDir;
 /// module. This minimizes redundant iteration and provides a single integration
 /// point for per-file override resolution.
 pub struct RuleDispatcher {
-    all_rules: Vec<Box<dyn Rule>>,
+    all_rules: &'static [Box<dyn Rule>],
 }
 
+/// Process-wide rule set. Rules are stateless, so every dispatcher (and every
+/// `LintEngine`, e.g. one per LSP config reload) shares a single instance.
+static ALL_RULES: std::sync::OnceLock<Vec<Box<dyn Rule>>> = std::sync::OnceLock::new();
+
 impl Default for RuleDispatcher {
     fn default() -> Self {
         Self::new()
@@ -29,10 +34,30 @@ impl Default for RuleDispatcher {
 impl RuleDispatcher {
     pub fn new() -> Self {
         Self {
-            all_rules: crate::rules::all_rules(),
+            all_rules: ALL_RULES.get_or_init(crate::rules::all_rules),
         }
     }
 
+    /// Resolve which rules run, and at what severity, under a rule table.
+    fn plan_for(&self, rules: &HashMap<String, RuleConfig>) -> RulePlan {
+        self.all_rules
+            .iter()
+            .filter_map(|rule| {
+                let rule_config = rules.get(rule.id());
+                let enabled = rule_config.and_then(|rc| rc.enabled).unwrap_or(true);
+                if !enabled {
+                    return None;
+                }
+                // Rules already report at their default severity, so only a
+                // configured change needs rewriting after the rule runs.
+                let severity = rule_config
+                    .and_then(|rc| rc.severity)
+                    .filter(|&s| s != rule.severity());
+                Some((rule.as_ref(), severity))
+            })
+            .collect()
+    }
+
     /// Check all rules against a single module in one pass, applying per-file
     /// config (global + overrides) for rule enablement and severity.
     pub fn check_module(
@@ -42,38 +67,38 @@ impl RuleDispatcher {
         ctx: &RuleContext,
         config: &Config,
     ) -> Result<Vec<Violation>> {
-        let effective = config.effective_rules_for_file(&module.file_path)?;
-        let mut violations = Vec::new();
-
-        for rule in &self.all_rules {
-            let rule_id = rule.id();
-
-            let enabled = effective
-                .get(rule_id)
-                .map(|rc| rc.enabled.unwrap_or(true))
-                .unwrap_or(true);
-
-            if !enabled {
-                continue;
-            }
-
-            let default_severity = rule.severity();
-            let severity = effective
-                .get(rule_id)
-                .and_then(|rc| rc.severity)
-                .unwrap_or(default_severity);
+        let plan = if config.overrides.is_empty() {
+            self.plan_for(&config.rules)
+        } else {
+            self.plan_for(&config.effective_rules_for_file(&module.file_path)?)
+        };
+        Ok(Self::run_plan(&plan, module, all_modules, ctx))
+    }
 
+    fn run_plan(
+        plan: &[(&'static dyn Rule, Option<Severity>)],
+        module: &ParsedModule,
+        all_modules: &[ParsedModule],
+        ctx: &RuleContext,
+    ) -> Vec<Violation> {
+        let mut violations = Vec::new();
+        for &(rule, severity) in plan {
             let mut v = rule.check(module, all_modules, ctx);
-            for violation in &mut v {
-                violation.severity = severity;
+            if let Some(severity) = severity {
+                for violation in &mut v {
+                    violation.severity = severity;
+                }
             }
             violations.append(&mut v);
         }
-
-        Ok(violations)
+        violations
     }
 }
 
+/// Rules enabled for a file, each paired with its configured severity when
+/// that differs from the rule's default.
+type RulePlan = Vec<(&'static dyn Rule, Option<Severity>)>;
+
 /// Memory budget for the linter.
 ///
 /// The engine processes files in a streaming fashion to keep peak RSS within
@@ -98,27 +123,41 @@ impl RuleDispatcher {
 pub struct LintEngine {
     dispatcher: RuleDispatcher,
     config: Config,
+    /// Enabled rules under the global config, resolved once so files without
+    /// overrides skip the per-rule table lookups.
+    global_plan: RulePlan,
     memory_limit_mb: usize,
+    /// Parser kept between `lint_source` calls so editor integrations do not
+    /// rebuild it on every keystroke.
+    source_parser: std::sync::Mutex<Option<crate::parser::PythonParser>>,
 }
 
 impl LintEngine {
     /// Create a new engine with rules filtered by the given configuration.
     #[allow(clippy::missing_errors_doc)]
     pub fn new(config: Config) -> Result<Self> {
+        let dispatcher = RuleDispatcher::new();
+        let global_plan = dispatcher.plan_for(&config.rules);
         Ok(Self {
-            dispatcher: RuleDispatcher::new(),
+            dispatcher,
             config,
+            global_plan,
             memory_limit_mb: 256,
+            source_parser: std::sync::Mutex::new(None),
         })
     }
 
     /// Create a LintEngine with an explicit memory limit (in MB).
     #[allow(clippy::missing_errors_doc)]
     pub fn with_memory_limit(config: Config, memory_limit_mb: usize) -> Result<Self> {
+        let dispatcher = RuleDispatcher::new();
+        let global_plan = dispatcher.plan_for(&config.rules);
         Ok(Self {
-            dispatcher: RuleDispatcher::new(),
+            dispatcher,
             config,
+            global_plan,
             memory_limit_mb,
+            source_parser: std::sync::Mutex::new(None),
         })
     }
 
@@ -126,6 +165,9 @@ impl LintEngine {
     #[allow(clippy::missing_errors_doc)]
     pub fn lint_paths(&self, paths: &[PathBuf]) -> Result<Vec<Violation>> {
         let files = discover_files(paths, &self.config.excludes);
+        if files.is_empty() {
+            return Ok(Vec::new());
+        }
 
         let (estimated_mb, over_budget) = exceeds_memory_budget(&files, self.memory_limit_mb);
         if over_budget {
@@ -136,7 +178,10 @@ impl LintEngine {
             );
         }
 
-        let modules = parse_files_parallel(&files);
+        let modules = match &self.config.cache {
+            Some(cache_path) => parse_files_cached(&files, cache_path),
+            None => parse_files_parallel(&files),
+        };
 
         let fixture_map = collect_all_fixtures(&modules);
         let used_fixture_names = compute_used_fixture_names(&modules);
@@ -152,9 +197,7 @@ impl LintEngine {
 
         let mut violations = Vec::new();
         for module in &modules {
-            let mut v = self
-                .dispatcher
-                .check_module(module, &modules, &ctx, &self.config)?;
+            let mut v = self.check_module(module, &modules, &ctx)?;
             violations.append(&mut v);
         }
 
@@ -179,10 +222,24 @@ impl LintEngine {
         file_path: &Path,
         context_modules: &[ParsedModule],
     ) -> Result<Vec<Violation>> {
-        let mut parser = crate::parser::PythonParser::new()?;
-        let module = parser.parse_source(source, file_path)?;
+        let cached = self.source_parser.lock().ok().and_then(|mut p| p.take());
+        let mut parser = match cached {
+            Some(p) => p,
+            None => crate::parser::PythonParser::new()?,
+        };
+        let parsed = parser.parse_source(source, file_path);
+        if let Ok(mut slot) = self.source_parser.lock() {
+            *slot = Some(parser);
+        }
+        let module = parsed?;
 
-        let mut all_modules: Vec<ParsedModule> = context_modules.to_vec();
+        // A stale copy of the file being linted must not be registered twice,
+        // or its fixtures would shadow themselves.
+        let mut all_modules: Vec<ParsedModule> = context_modules
+            .iter()
+            .filter(|m| m.file_path != module.file_path)
+            .cloned()
+            .collect();
         all_modules.push(module);
         let primary = &all_modules[all_modules.len() - 1];
 
@@ -198,11 +255,28 @@ impl LintEngine {
             session_mutable_fixtures: &session_mutable_fixtures,
         };
 
-        let violations = self
-            .dispatcher
-            .check_module(primary, &all_modules, &ctx, &self.config)?;
+        self.check_module(primary, &all_modules, &ctx)
+    }
 
-        Ok(violations)
+    /// Run the dispatcher over one module, reusing the resolved global rule
+    /// plan unless per-file overrides are configured.
+    fn check_module(
+        &self,
+        module: &ParsedModule,
+        all_modules: &[ParsedModule],
+        ctx: &RuleContext,
+    ) -> Result<Vec<Violation>> {
+        if self.config.overrides.is_empty() {
+            Ok(RuleDispatcher::run_plan(
+                &self.global_plan,
+                module,
+                all_modules,
+                ctx,
+            ))
+        } else {
+            self.dispatcher
+                .check_module(module, all_modules, ctx, &self.config)
+        }
     }
 }
 
@@ -259,7 +333,11 @@ fn discover_files(paths: &[PathBuf], exclude_dirs: &[String]) -> Vec<PathBuf> {
                 .filter_map(std::result::Result::ok)
             {
                 let p = entry.path();
-                if p.is_file() && is_py_test_file(p) {
+                // Match the name first and reuse the file type walkdir already
+                // read from the directory listing; only symlinks need a stat.
+                if is_py_test_file(p)
+                    && (entry.file_type().is_file() || (entry.path_is_symlink() && p.is_file()))
+                {
                     files.push(p.to_path_buf());
                 }
             }
@@ -280,38 +358,105 @@ fn is_test_file(path: &Path) -> bool {
     name.starts_with("test_") || name.ends_with("_test.py") || name == "conftest.py"
 }
 
-/// Parse multiple files in parallel using rayon.
+/// Parse multiple files in parallel using rayon. Each worker sets up one
+/// tree-sitter parser and reuses it for every file it handles.
 fn parse_files_parallel(files: &[PathBuf]) -> Vec<ParsedModule> {
+    // Every worker would hit the same setup error, so report it only once.
+    let init_warned = std::sync::atomic::AtomicBool::new(false);
     files
         .par_iter()
-        .filter_map(|file| {
-            let mut parser = crate::parser::PythonParser::new().ok()?;
-            match parser.parse_file(file) {
-                Ok(m) => Some(m),
-                Err(e) => {
-                    eprintln!("Warning: failed to parse {}: {}", file.display(), e);
-                    None
+        .map_init(
+            || {
+                crate::parser::PythonParser::new()
+                    .map_err(|e| {
+                        if !init_warned.swap(true, std::sync::atomic::Ordering::Relaxed) {
+                            eprintln!("Warning: failed to initialise Python parser: {e}");
+                        }
+                    })
+                    .ok()
+            },
+            |parser, file| {
+                let parser = parser.as_mut()?;
+                match parser.parse_file(file) {
+                    Ok(m) => Some(m),
+                    Err(e) => {
+                        eprintln!("Warning: failed to parse {}: {}", file.display(), e);
+                        None
+                    }
                 }
+            },
+        )
+        .flatten()
+        .collect()
+}
+
+/// Parse `files`, reusing unchanged conftest.py modules from the on-disk cache
+/// at `cache_path` and recording fresh parses of them for the next run.
+/// Module order matches `files`, as with `parse_files_parallel`.
+fn parse_files_cached(files: &[PathBuf], cache_path: &Path) -> Vec<ParsedModule> {
+    let mut cache = ParseCache::load(cache_path);
+    let mut cached: HashMap<&Path, ParsedModule> = HashMap::new();
+    let mut misses = Vec::new();
+    let mut stamps = Vec::new();
+    for file in files {
+        if ParseCache::is_cacheable(file) {
+            if let Some(module) = cache.get(file) {
+                cached.insert(file.as_path(), module);
+                continue;
             }
+            // Stamped before reading so an edit made mid-run is never
+            // cached under the new timestamp.
+            if let Some(stamp) = FileStamp::of(file) {
+                stamps.push((file.as_path(), stamp));
+            }
+        }
+        misses.push(file.clone());
+    }
+    if cached.is_empty() && stamps.is_empty() {
+        return parse_files_parallel(files);
+    }
+
+    let mut parsed: HashMap<PathBuf, ParsedModule> = parse_files_parallel(&misses)
+        .into_iter()
+        .map(|m| (m.file_path.clone(), m))
+        .collect();
+    for (path, stamp) in stamps {
+        if let Some(module) = parsed.get(path) {
+            cache.insert(module, stamp);
+        }
+    }
+    if let Err(e) = cache.save() {
+        eprintln!(
+            "Warning: failed to write parse cache {}: {e}",
+            cache_path.display()
+        );
+    }
+
+    files
+        .iter()
+        .filter_map(|file| {
+            cached
+                .remove(file.as_path())
+                .or_else(|| parsed.remove(file))
         })
         .collect()
 }
 
-type SuppressionMap = HashMap<(PathBuf, usize), HashSet<String>>;
+/// Keys borrow the module's path so lookups don't clone a `PathBuf` per violation.
+type SuppressionMap<'a> = HashMap<(&'a Path, usize), HashSet<String>>;
 
-fn collect_suppressions(modules: &[ParsedModule]) -> SuppressionMap {
+fn collect_suppressions(modules: &[ParsedModule]) -> SuppressionMap<'_> {
     let mut map: SuppressionMap = HashMap::new();
     for module in modules {
+        let path = module.file_path.as_path();
         for (line_idx, line) in module.source.lines().enumerate() {
             let line_num = line_idx + 1;
             if let Some(rules) = parse_noqa_comment(line) {
-                map.entry((module.file_path.clone(), line_num))
-                    .or_default()
-                    .extend(rules);
                 // Also suppress on the next line (inline noqa applies to the statement)
-                map.entry((module.file_path.clone(), line_num + 1))
+                map.entry((path, line_num + 1))
                     .or_default()
-                    .extend(parse_noqa_comment(line).unwrap_or_default());
+                    .extend(rules.iter().cloned());
+                map.entry((path, line_num)).or_default().extend(rules);
             }
         }
     }
@@ -355,14 +500,15 @@ fn parse_noqa_comment(line: &str) -> Option<Vec<String>> {
 /// Check if a violation is suppressed by a noqa comment.
 fn is_suppressed(violation: &Violation, suppressions: &SuppressionMap) -> bool {
     // Check the violation's line
-    if let Some(rules) = suppressions.get(&(violation.file_path.clone(), violation.line)) {
+    if let Some(rules) = suppressions.get(&(violation.file_path.as_path(), violation.line)) {
         if rules.contains("*") || rules.contains(&violation.rule_id) {
             return true;
         }
     }
     // Also check the line above (noqa on previous line)
     if violation.line > 1 {
-        if let Some(rules) = suppressions.get(&(violation.file_path.clone(), violation.line - 1)) {
+        if let Some(rules) = suppressions.get(&(violation.file_path.as_path(), violation.line - 1))
+        {
             if rules.contains("*") || rules.contains(&violation.rule_id) {
                 return true;
             }
@@ -372,26 +518,40 @@ fn is_suppressed(violation: &Violation, suppressions: &SuppressionMap) -> bool {
 }
 
 /// Build a map of fixture name to all fixture definitions across modules.
+///
+/// Keys borrow the fixture names from the modules, so a name shared by many
+/// definitions is never copied.
 #[must_use]
-pub fn collect_all_fixtures(modules: &[ParsedModule]) -> HashMap<String, Vec<&Fixture>> {
-    let mut map: HashMap<String, Vec<&Fixture>> = HashMap::new();
+pub fn collect_all_fixtures(modules: &[ParsedModule]) -> HashMap<&str, Vec<&Fixture>> {
+    let mut map: HashMap<&str, Vec<&Fixture>> = HashMap::new();
     for module in modules {
         for fixture in &module.fixtures {
-            map.entry(fixture.name.clone()).or_default().push(fixture);
+            map.entry(fixture.name.as_str()).or_default().push(fixture);
         }
     }
     map
 }
 
-/// Build a map of fixture name to the file paths where it is defined.
+/// Build a map of shadowed fixture name to the file paths where it is defined.
+///
+/// Only names with more than one definition are included, so shadowing checks
+/// are a single lookup. Names and paths are borrowed from the modules rather than cloned
+/// per definition.
 #[must_use]
-pub fn compute_fixture_locations(modules: &[ParsedModule]) -> HashMap<String, Vec<PathBuf>> {
-    let mut map: HashMap<String, Vec<PathBuf>> = HashMap::new();
+pub fn compute_fixture_locations(modules: &[ParsedModule]) -> HashMap<&str, Vec<&Path>> {
+    let mut counts: HashMap<&str, usize> = HashMap::new();
+    for fixture in modules.iter().flat_map(|m| m.fixtures.iter()) {
+        *counts.entry(&fixture.name).or_default() += 1;
+    }
+    let mut map: HashMap<&str, Vec<&Path>> = HashMap::new();
     for module in modules {
         for fixture in &module.fixtures {
-            map.entry(fixture.name.clone())
-                .or_default()
-                .push(module.file_path.clone());
+            let n = counts.get(fixture.name.as_str()).copied().unwrap_or(0);
+            if n > 1 {
+                map.entry(fixture.name.as_str())
+                    .or_insert_with(|| Vec::with_capacity(n))
+                    .push(module.file_path.as_path());
+            }
         }
     }
     map
@@ -399,19 +559,19 @@ pub fn compute_fixture_locations(modules: &[ParsedModule]) -> HashMap<String, Ve
 
 /// Collect names of session-scoped fixtures that return mutable state.
 #[must_use]
-pub fn compute_session_mutable_fixtures(modules: &[ParsedModule]) -> HashSet<String> {
+pub fn compute_session_mutable_fixtures(modules: &[ParsedModule]) -> HashSet<&str> {
     modules
         .iter()
         .flat_map(|m| m.fixtures.iter())
         .filter(|f| f.scope == crate::models::FixtureScope::Session && f.returns_mutable)
-        .map(|f| f.name.clone())
+        .map(|f| f.name.as_str())
         .collect()
 }
 
 /// Look up the narrowest scope for a fixture by name across all modules.
 #[must_use]
 pub fn fixture_scope_by_name<S: BuildHasher>(
-    all_fixtures: &HashMap<String, Vec<&Fixture>, S>,
+    all_fixtures: &HashMap<&str, Vec<&Fixture>, S>,
     name: &str,
 ) -> Option<FixtureScope> {
     all_fixtures
@@ -444,32 +604,33 @@ pub fn is_fixture_used_by_any_test_or_fixture(
 
 /// Compute the transitive closure of fixture names used by tests.
 #[must_use]
-pub fn compute_used_fixture_names(modules: &[ParsedModule]) -> HashSet<String> {
-    let mut fixture_deps_map: HashMap<&str, Vec<&String>> = HashMap::new();
+pub fn compute_used_fixture_names(modules: &[ParsedModule]) -> HashSet<&str> {
+    let mut fixture_deps_map: HashMap<&str, &[String]> = HashMap::new();
     for module in modules {
         for fixture in &module.fixtures {
-            fixture_deps_map.insert(&fixture.name, fixture.dependencies.iter().collect());
+            fixture_deps_map.insert(&fixture.name, &fixture.dependencies);
         }
     }
 
-    let mut used = HashSet::new();
-    let mut worklist = Vec::new();
+    // Names are borrowed from the modules throughout; nothing is copied.
+    let mut used: HashSet<&str> = HashSet::new();
+    let mut worklist: Vec<&str> = Vec::new();
 
     for module in modules {
         for test in &module.test_functions {
             for dep in &test.fixture_deps {
-                if used.insert(dep.clone()) {
-                    worklist.push(dep.clone());
+                if used.insert(dep) {
+                    worklist.push(dep);
                 }
             }
         }
     }
 
     while let Some(name) = worklist.pop() {
-        if let Some(deps) = fixture_deps_map.get(name.as_str()) {
-            for dep in deps {
-                if used.insert(dep.to_string()) {
-                    worklist.push(dep.to_string());
+        if let Some(deps) = fixture_deps_map.get(name) {
+            for dep in *deps {
+                if used.insert(dep) {
+                    worklist.push(dep);
                 }
             }
         }
@@ -507,7 +668,8 @@ pub fn make_violation(
 }
 
 /// Check whether a path is a Python test file (both .py extension and test naming).
-fn is_py_test_file(path: &Path) -> bool {
+#[must_use]
+pub fn is_py_test_file(path: &Path) -> bool {
     path.extension().is_some_and(|e| e == "py") && is_test_file(path)
 }
 
@@ -597,16 +759,22 @@ pub fn save_baseline(violations: &[Violation], path: &Path) -> Result<()> {
             rule_id: v.rule_id.clone(),
         })
         .collect();
-    let json = serde_json::to_string_pretty(&entries)?;
-    std::fs::write(path, json)?;
+    let json = serde_json::to_vec_pretty(&entries)?;
+    // Write beside the target and rename over it, so an interrupted run never
+    // leaves a truncated baseline behind.
+    let mut tmp = path.as_os_str().to_owned();
+    tmp.push(".tmp");
+    std::fs::write(&tmp, json)?;
+    std::fs::rename(&tmp, path)?;
     Ok(())
 }
 
 /// Load a baseline of known violations from a JSON file.
 #[allow(clippy::missing_errors_doc)]
 pub fn load_baseline(path: &Path) -> Result<HashSet<(String, usize, String)>> {
-    let content = std::fs::read_to_string(path)?;
-    let entries: Vec<BaselineEntry> = serde_json::from_str(&content)?;
+    // serde_json validates UTF-8 while parsing, so skip the separate decode pass.
+    let content = std::fs::read(path)?;
+    let entries: Vec<BaselineEntry> = serde_json::from_slice(&content)?;
     let set: HashSet<(String, usize, String)> = entries
         .into_iter()
         .map(|e| (e.file_path, e.line, e.rule_id))
@@ -660,13 +828,16 @@ pub fn format_terminal_output(
 }
 
 fn format_terminal(violations: &[Violation], output_path: Option<&Path>) -> Result<()> {
+    // Buffer the report so each line is not its own write syscall; stdout is
+    // otherwise line-buffered and files are not buffered at all.
     let mut writer: Box<dyn Write> = match output_path {
-        Some(path) => Box::new(std::fs::File::create(path)?),
-        None => Box::new(std::io::stdout()),
+        Some(path) => Box::new(BufWriter::new(std::fs::File::create(path)?)),
+        None => Box::new(BufWriter::new(std::io::stdout().lock())),
     };
 
     if violations.is_empty() {
         writeln!(writer, "{} No violations found", "✓".green())?;
+        writer.flush()?;
         return Ok(());
     }
 
@@ -721,6 +892,7 @@ fn format_terminal(violations: &[Violation], output_path: Option<&Path>) -> Resu
         warning_count.to_string().yellow(),
         info_count.to_string().blue()
     )?;
+    writer.flush()?;
 
     Ok(())
 }
@@ -759,6 +931,36 @@ mod tests {
     use std::fs;
     use std::path::PathBuf;
 
+    #[test]
+    fn test_rule_plan_applies_enablement_and_severity() {
+        let dispatcher = RuleDispatcher::new();
+        let mut config = Config::default();
+        config.rules.insert(
+            "PYTEST-FLK-001".to_string(),
+            RuleConfig {
+                enabled: Some(false),
+                severity: None,
+            },
+        );
+        config.rules.insert(
+            "PYTEST-FLK-002".to_string(),
+            RuleConfig {
+                enabled: None,
+                severity: Some(Severity::Info),
+            },
+        );
+        let plan = dispatcher.plan_for(&config.rules);
+        assert!(plan.iter().all(|(rule, _)| rule.id() != "PYTEST-FLK-001"));
+        let flk002 = plan.iter().find(|(rule, _)| rule.id() == "PYTEST-FLK-002");
+        assert_eq!(
+            flk002.map(|(_, severity)| *severity),
+            Some(Some(Severity::Info))
+        );
+        let flk003 = plan.iter().find(|(rule, _)| rule.id() == "PYTEST-FLK-003");
+        assert_eq!(flk003.map(|(_, severity)| *severity), Some(None));
+        assert_eq!(plan.len(), dispatcher.all_rules.len() - 1);
+    }
+
     #[test]
     fn test_is_test_file_detects_test_prefix() {
         assert!(is_test_file(Path::new("test_foo.py")));
@@ -786,8 +988,8 @@ mod tests {
             .parse_source("x = 1  # noqa\n", Path::new("test.py"))
             .unwrap();
         let suppressions = collect_suppressions(std::slice::from_ref(&module));
-        assert!(suppressions.contains_key(&(PathBuf::from("test.py"), 1)));
-        let rules = suppressions.get(&(PathBuf::from("test.py"), 1)).unwrap();
+        assert!(suppressions.contains_key(&(Path::new("test.py"), 1)));
+        let rules = suppressions.get(&(Path::new("test.py"), 1)).unwrap();
         assert!(rules.contains("*"), "bare noqa should suppress all rules");
     }
 
@@ -798,7 +1000,7 @@ mod tests {
             .parse_source("x = 1  # noqa: PYTEST-FLK-001\n", Path::new("test.py"))
             .unwrap();
         let suppressions = collect_suppressions(std::slice::from_ref(&module));
-        let rules = suppressions.get(&(PathBuf::from("test.py"), 1)).unwrap();
+        let rules = suppressions.get(&(Path::new("test.py"), 1)).unwrap();
         assert!(
             rules.contains(&"PYTEST-FLK-001".to_string()),
             "should contain specific rule"
@@ -816,7 +1018,7 @@ mod tests {
             .unwrap();
         let suppressions = collect_suppressions(std::slice::from_ref(&module));
         assert!(
-            suppressions.contains_key(&(PathBuf::from("test.py"), 2)),
+            suppressions.contains_key(&(Path::new("test.py"), 2)),
             "noqa should also suppress on next line"
         );
     }
@@ -838,7 +1040,7 @@ mod tests {
         };
         let mut suppressions = std::collections::HashMap::new();
         suppressions.insert(
-            (PathBuf::from("test.py"), 5),
+            (Path::new("test.py"), 5),
             std::collections::HashSet::from(["PYTEST-FLK-001".to_string()]),
         );
         assert!(is_suppressed(&v, &suppressions));
@@ -861,7 +1063,7 @@ mod tests {
         };
         let mut suppressions = std::collections::HashMap::new();
         suppressions.insert(
-            (PathBuf::from("test.py"), 4),
+            (Path::new("test.py"), 4),
             std::collections::HashSet::from(["*".to_string()]),
         );
         assert!(
@@ -1039,6 +1241,63 @@ mod tests {
         assert!(!violations.is_empty(), "lint_source should find violations");
     }
 
+    #[test]
+    fn test_lint_source_with_context_ignores_stale_copy_of_same_file() {
+        let engine = LintEngine::new(crate::config::Config::default()).unwrap();
+        let source = "import pytest\n\n@pytest.fixture\ndef db():\n    return 1\n\ndef test_db(db):\n    assert db == 1\n";
+        let path = Path::new("test_db.py");
+        let stale = crate::parser::PythonParser::new()
+            .unwrap()
+            .parse_source(source, path)
+            .unwrap();
+        let violations = engine
+            .lint_source_with_context(source, path, &[stale])
+            .unwrap();
+        assert!(
+            !violations.iter().any(|v| v.rule_id == "PYTEST-FIX-004"),
+            "file must not shadow its own fixtures: {violations:?}"
+        );
+    }
+
+    #[test]
+    fn test_fixture_locations_only_lists_shadowed_names() {
+        let mut parser = crate::parser::PythonParser::new().unwrap();
+        let fixtures = "import pytest\n\n@pytest.fixture\ndef db():\n    return 1\n\n@pytest.fixture\ndef api():\n    return 2\n";
+        let a = parser
+            .parse_source(fixtures, Path::new("conftest.py"))
+            .unwrap();
+        let b = parser
+            .parse_source(
+                "import pytest\n\n@pytest.fixture\ndef db():\n    return 3\n",
+                Path::new("tests/conftest.py"),
+            )
+            .unwrap();
+        let modules = [a, b];
+        let locations = compute_fixture_locations(&modules);
+        assert_eq!(locations.len(), 1);
+        assert_eq!(
+            locations["db"],
+            vec![Path::new("conftest.py"), Path::new("tests/conftest.py")]
+        );
+    }
+
+    #[test]
+    fn test_lint_source_reuses_parser_across_calls() {
+        let engine = LintEngine::new(crate::config::Config::default()).unwrap();
+        let sleepy = "import time\ndef test_sleep():\n    time.sleep(1)\n";
+        let first = engine.lint_source(sleepy, Path::new("test_a.py")).unwrap();
+        let second = engine
+            .lint_source(
+                "def test_ok():\n    assert 1 == 1\n",
+                Path::new("test_b.py"),
+            )
+            .unwrap();
+        let third = engine.lint_source(sleepy, Path::new("test_a.py")).unwrap();
+        assert!(!first.is_empty());
+        assert!(second.iter().all(|v| v.rule_id != "PYTEST-FLK-001"));
+        assert_eq!(first, third);
+    }
+
     #[test]
     fn test_lint_source_clean_returns_nothing() {
         let engine = LintEngine::new(crate::config::Config::default()).unwrap();
@@ -1175,7 +1434,7 @@ mod tests {
         let mut suppressions = std::collections::HashMap::new();
         // Insert a suppression at line 0 (which should NOT suppress line 1)
         suppressions.insert(
-            (PathBuf::from("test.py"), 0),
+            (Path::new("test.py"), 0),
             std::collections::HashSet::from(["*".to_string()]),
         );
         assert!(
@@ -1224,8 +1483,10 @@ mod tests {
                 body_hash: None,
                 uses_random: false,
                 has_random_seed: false,
+                random_call_lines: vec![],
                 uses_subprocess: false,
                 has_subprocess_timeout: false,
+                unguarded_subprocess_lines: vec![],
                 mocks_stdlib_module: false,
                 mocked_stdlib_targets: vec![],
                 has_weak_assertions: false,
@@ -1250,7 +1511,6 @@ mod tests {
                     has_db_rollback: false,
                     has_cleanup: false,
                     uses_file_io: false,
-                    used_by: vec![],
                 },
                 // unrelated_fixture does NOT depend on db_connection
                 Fixture {
@@ -1266,7 +1526,6 @@ mod tests {
                     has_db_rollback: false,
                     has_cleanup: false,
                     uses_file_io: false,
-                    used_by: vec![],
                 },
             ],
         };
@@ -1313,8 +1572,10 @@ mod tests {
                 body_hash: None,
                 uses_random: false,
                 has_random_seed: false,
+                random_call_lines: vec![],
                 uses_subprocess: false,
                 has_subprocess_timeout: false,
+                unguarded_subprocess_lines: vec![],
                 mocks_stdlib_module: false,
                 mocked_stdlib_targets: vec![],
                 has_weak_assertions: false,
@@ -1338,7 +1599,6 @@ mod tests {
                 has_db_rollback: false,
                 has_cleanup: false,
                 uses_file_io: false,
-                used_by: vec![],
             }],
         };
         assert!(
@@ -1384,8 +1644,10 @@ mod tests {
                 body_hash: None,
                 uses_random: false,
                 has_random_seed: false,
+                random_call_lines: vec![],
                 uses_subprocess: false,
                 has_subprocess_timeout: false,
+                unguarded_subprocess_lines: vec![],
                 mocks_stdlib_module: false,
                 mocked_stdlib_targets: vec![],
                 has_weak_assertions: false,
@@ -1410,7 +1672,6 @@ mod tests {
                     has_db_rollback: false,
                     has_cleanup: false,
                     uses_file_io: false,
-                    used_by: vec![],
                 },
                 Fixture {
                     name: "db_connection".to_string(),
@@ -1425,7 +1686,6 @@ mod tests {
                     has_db_rollback: false,
                     has_cleanup: false,
                     uses_file_io: false,
-                    used_by: vec![],
                 },
             ],
         };
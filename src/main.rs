@@ -42,6 +42,10 @@ struct Cli {
 
     #[arg(long, conflicts_with = "baseline")]
     check_baseline: Option<PathBuf>,
+
+    /// Reuse parsed conftest.py files across runs via this cache file.
+    #[arg(long, value_name = "FILE")]
+    cache: Option<PathBuf>,
 }
 
 fn main() -> Result<()> {
@@ -56,6 +60,9 @@ fn main() -> Result<()> {
     all_excludes.extend(cli.exclude.iter().cloned());
 
     config = config.merge_cli(cli.format.clone(), cli.output.clone(), all_excludes);
+    if cli.cache.is_some() {
+        config.cache = cli.cache.clone();
+    }
 
     let format_str = config
         .format
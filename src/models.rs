@@ -97,8 +97,10 @@ pub struct TestFunction {
     pub body_hash: Option<u64>,
     pub uses_random: bool,
     pub has_random_seed: bool,
+    pub random_call_lines: Vec<usize>,
     pub uses_subprocess: bool,
     pub has_subprocess_timeout: bool,
+    pub unguarded_subprocess_lines: Vec<usize>,
     pub mocks_stdlib_module: bool,
     pub mocked_stdlib_targets: Vec<String>,
     pub has_weak_assertions: bool,
@@ -149,7 +151,6 @@ pub struct Fixture {
     pub has_db_rollback: bool,
     pub has_cleanup: bool,
     pub uses_file_io: bool,
-    pub used_by: Vec<String>,
 }
 
 /// Result of parsing a single Python test file: imports, tests, and fixtures.
@@ -115,6 +115,8 @@ pub fn violations_to_sarif(violations: &[Violation]) -> SarifLog {
     // Collect unique rules for the driver
     let mut rules_map: HashMap<String, Rule> = HashMap::new();
     let mut results: Vec<SarifResult> = Vec::new();
+    // Violations cluster by file, so each path is converted to a URI once.
+    let mut uris: HashMap<&std::path::Path, String> = HashMap::new();
 
     for v in violations {
         let level = match v.severity {
@@ -149,7 +151,10 @@ pub fn violations_to_sarif(violations: &[Violation]) -> SarifLog {
             locations: vec![Location {
                 physical_location: PhysicalLocation {
                     artifact_location: ArtifactLocation {
-                        uri: path_to_file_uri(&v.file_path),
+                        uri: uris
+                            .entry(v.file_path.as_path())
+                            .or_insert_with(|| path_to_file_uri(&v.file_path))
+                            .clone(),
                     },
                     region: Region {
                         start_line: v.line,
@@ -3,13 +3,412 @@ use anyhow::Result;
 use std::collections::HashSet;
 use std::hash::{Hash, Hasher};
 use std::path::Path;
+use std::sync::OnceLock;
 use tree_sitter::Parser;
 
+/// Grammar ids of the node kinds the body walkers test on every node.
+/// Comparing `kind_id()` skips the C-string conversion behind `kind()`.
+struct NodeKinds {
+    assert_statement: u16,
+    assignment: u16,
+    attribute: u16,
+    call: u16,
+    comparison_operator: u16,
+    delete_statement: u16,
+    identifier: u16,
+    if_statement: u16,
+    return_statement: u16,
+    subscript: u16,
+    try_statement: u16,
+    yield_expr: u16,
+}
+
+fn kinds() -> &'static NodeKinds {
+    static KINDS: OnceLock<NodeKinds> = OnceLock::new();
+    KINDS.get_or_init(|| {
+        let language: tree_sitter::Language = tree_sitter_python::LANGUAGE.into();
+        let id = |kind: &str| language.id_for_node_kind(kind, true);
+        NodeKinds {
+            assert_statement: id("assert_statement"),
+            assignment: id("assignment"),
+            attribute: id("attribute"),
+            call: id("call"),
+            comparison_operator: id("comparison_operator"),
+            delete_statement: id("delete_statement"),
+            identifier: id("identifier"),
+            if_statement: id("if_statement"),
+            return_statement: id("return_statement"),
+            subscript: id("subscript"),
+            try_statement: id("try_statement"),
+            yield_expr: id("yield"),
+        }
+    })
+}
+
+/// Visit `root` and its descendants in pre-order, stopping as soon as `visit`
+/// returns `false`. One cursor serves the whole walk, instead of a fresh cursor
+/// and a stack frame per node.
+fn walk_preorder<'t>(
+    root: tree_sitter::Node<'t>,
+    mut visit: impl FnMut(tree_sitter::Node<'t>) -> bool,
+) {
+    let mut cursor = root.walk();
+    loop {
+        if !visit(cursor.node()) {
+            return;
+        }
+        if cursor.goto_first_child() || cursor.goto_next_sibling() {
+            continue;
+        }
+        loop {
+            if !cursor.goto_parent() {
+                return;
+            }
+            if cursor.goto_next_sibling() {
+                break;
+            }
+        }
+    }
+}
+
+/// Whether a call passes a `timeout` keyword argument.
+fn call_has_timeout(call: tree_sitter::Node, source: &[u8]) -> bool {
+    let args = match call.child_by_field_name("arguments") {
+        Some(a) => a,
+        None => return false,
+    };
+    let mut cursor = args.walk();
+    let has_timeout = args.children(&mut cursor).any(|child| {
+        child.kind() == "keyword_argument"
+            && child
+                .child_by_field_name("name")
+                .is_some_and(|n| n.utf8_text(source).unwrap_or_default() == "timeout")
+    });
+    has_timeout
+}
+
+/// Parameters that are never fixture requests.
+const IGNORED_PARAMS: &[&str] = &["self", "cls"];
+
+/// Methods that mutate a list, dict or set in place.
+const MUTATING_METHODS: &[&str] = &[
+    "append", "extend", "remove", "pop", "clear", "update", "insert", "add", "discard",
+];
+
+/// Text fragments in a fixture body that indicate explicit teardown or a
+/// self-cleaning resource.
+const CLEANUP_TEXT_PATTERNS: &[&str] = &[
+    ".close()",
+    ".teardown_",
+    "env_reset",
+    ".restore()",
+    ".cleanup()",
+    ".remove()",
+    ".unlink()",
+    "addfinalizer",
+    "mock.patch",
+    "patch(",
+    "tmp_path",
+    "tmpdir",
+];
+
+/// Modules whose calls reach the network.
+const NETWORK_LIBS: &[&str] = &["requests", "socket", "httpx", "aiohttp", "urllib"];
+
+/// Text fragments counted as one use of a mock each.
+const MOCK_KEYWORDS: &[&str] = &[
+    "Mock(",
+    "MagicMock(",
+    "AsyncMock(",
+    "patch(",
+    ".return_value",
+    ".side_effect",
+    ".assert_called",
+    ".called",
+    ".call_count",
+    ".assert_called_once",
+    ".assert_called_with",
+    ".assert_not_called",
+];
+
+/// Mock attributes that only verify interactions.
+const MOCK_VERIFICATION_KEYWORDS: &[&str] = &[".assert_called", ".called", ".call_count"];
+
+/// Constructors whose result is immutable.
+const IMMUTABLE_CONSTRUCTORS: &[&str] = &[
+    "int",
+    "str",
+    "float",
+    "bool",
+    "bytes",
+    "complex",
+    "tuple",
+    "frozenset",
+    "NoneType",
+    "Path",
+    "PurePath",
+    "PurePosixPath",
+    "PureWindowsPath",
+    "Decimal",
+    "date",
+    "datetime",
+    "time",
+    "timedelta",
+    "UUID",
+    "ipaddress",
+    "IPv4Address",
+    "IPv6Address",
+    "re.compile",
+    "enum",
+];
+
+/// Constructors whose result is mutable.
+const MUTABLE_CONSTRUCTORS: &[&str] = &[
+    "list",
+    "dict",
+    "set",
+    "bytearray",
+    "deque",
+    "defaultdict",
+    "Counter",
+    "OrderedDict",
+];
+
+/// `subprocess` entry points that accept a `timeout` argument.
+const SUBPROCESS_FUNCTIONS: &[&str] = &[
+    "subprocess.Popen",
+    "subprocess.run",
+    "subprocess.call",
+    "subprocess.check_output",
+    "subprocess.check_call",
+];
+
+/// Assertion helpers that only check type, existence or key presence.
+const WEAK_ASSERTION_PATTERNS: &[(&str, &str)] = &[
+    ("assertIsInstance", "type-only assertion"),
+    ("isinstance", "type-only assertion"),
+    ("assertTrue", "existence-only assertion"),
+    ("assertIsNotNone", "existence-only assertion"),
+    ("assertIn", "key-presence-only assertion"),
+];
+
+/// What a decorator marks its function as, resolved once from its name.
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum DecoratorKind {
+    Parametrize,
+    Fixture,
+    Other,
+}
+
+/// Fixture-body facts gathered in one walk instead of one walk per detector.
+#[derive(Default)]
+#[allow(clippy::struct_excessive_bools)]
+struct FixtureBodyScan {
+    returns_mutable: bool,
+    has_yield: bool,
+    has_db_commit: bool,
+    has_db_rollback: bool,
+    uses_file_io: bool,
+}
+
+impl FixtureBodyScan {
+    fn of(
+        body: Option<&tree_sitter::Node>,
+        source: &[u8],
+        frozen_classes: &HashSet<String>,
+    ) -> Self {
+        let mut scan = Self::default();
+        if let Some(b) = body {
+            walk_preorder(*b, |node| {
+                scan.visit(node, source, frozen_classes);
+                !scan.is_complete()
+            });
+        }
+        scan
+    }
+
+    fn visit(&mut self, node: tree_sitter::Node, source: &[u8], frozen_classes: &HashSet<String>) {
+        let k = kinds();
+        let kind = node.kind_id();
+        if kind == k.call {
+            if let Some(c) = Callee::of(node, source) {
+                self.uses_file_io = self.uses_file_io || c.is_file_io();
+                self.has_db_commit = self.has_db_commit || c.is_db_call("commit");
+                self.has_db_rollback = self.has_db_rollback || c.is_db_call("rollback");
+            }
+        } else if kind == k.identifier {
+            let name = PythonParser::node_str(node, source);
+            self.has_db_commit = self.has_db_commit || name.eq_ignore_ascii_case("commit");
+            self.has_db_rollback = self.has_db_rollback || name.eq_ignore_ascii_case("rollback");
+        } else if kind == k.yield_expr {
+            self.has_yield = true;
+        } else if kind == k.return_statement && !self.returns_mutable {
+            let mut cursor = node.walk();
+            self.returns_mutable = node
+                .children(&mut cursor)
+                .any(|child| PythonParser::is_mutable_node(child, source, frozen_classes));
+        }
+    }
+
+    /// Every fact is already known, so the rest of the body can't change the result.
+    fn is_complete(&self) -> bool {
+        self.returns_mutable
+            && self.has_yield
+            && self.has_db_commit
+            && self.has_db_rollback
+            && self.uses_file_io
+    }
+}
+
+/// A decorator on a test or fixture; `text` borrows the source it was parsed from.
 struct DecoratorInfo<'a> {
-    text: String,
+    text: &'a str,
+    kind: DecoratorKind,
     node: Option<tree_sitter::Node<'a>>,
 }
 
+/// Callee of a `call` node, resolved once so each detector can test it
+/// without re-reading the function node.
+struct Callee<'s> {
+    text: &'s str,
+    object: Option<&'s str>,
+    attribute: Option<&'s str>,
+}
+
+impl<'s> Callee<'s> {
+    fn of(call: tree_sitter::Node, source: &'s [u8]) -> Option<Self> {
+        let func = call.child_by_field_name("function")?;
+        let text = func.utf8_text(source).unwrap_or_default();
+        let (object, attribute) = if func.kind() == "attribute" {
+            let field = |name| {
+                func.child_by_field_name(name)
+                    .map(|n| n.utf8_text(source).unwrap_or_default())
+            };
+            (field("object"), field("attribute"))
+        } else {
+            (None, None)
+        };
+        Some(Self {
+            text,
+            object,
+            attribute,
+        })
+    }
+
+    // Dotted callees always parse as attributes, so `object`/`attribute`
+    // already cover the qualified names (`time.sleep`, `os.getcwd`,
+    // `random.seed`, ...); each predicate is a couple of `match` arms.
+
+    fn is_time_sleep(&self) -> bool {
+        self.text == "sleep" || self.attribute == Some("sleep")
+    }
+
+    fn is_file_io(&self) -> bool {
+        matches!(self.text, "open" | "read" | "write")
+            || matches!(self.attribute, Some("read" | "write" | "open"))
+    }
+
+    fn is_network(&self) -> bool {
+        // `lib.func` / `lib (`: look the leading name up once rather
+        // than formatting a prefix per library.
+        let leading_lib = |sep: &str| {
+            self.text
+                .split_once(sep)
+                .is_some_and(|(head, _)| NETWORK_LIBS.contains(&head))
+        };
+        leading_lib(".")
+            || leading_lib(" (")
+            || self.object.is_some_and(|o| NETWORK_LIBS.contains(&o))
+    }
+
+    fn is_cwd(&self) -> bool {
+        self.text == "Path.cwd" || self.text.contains("getcwd") || self.text.contains("chdir")
+    }
+
+    /// `method` is a lowercase DB method name such as "commit".
+    fn is_db_call(&self, method: &str) -> bool {
+        contains_ignore_ascii_case(self.text, method)
+            || self
+                .attribute
+                .is_some_and(|a| a.eq_ignore_ascii_case(method))
+    }
+}
+
+/// Test-body facts gathered in one walk instead of one walk per detector.
+#[derive(Default)]
+#[allow(clippy::struct_excessive_bools)]
+struct BodyScan {
+    assertion_count: usize,
+    has_conditional_logic: bool,
+    has_try_except: bool,
+    uses_time_sleep: bool,
+    uses_file_io: bool,
+    uses_network: bool,
+    uses_cwd_dependency: bool,
+    uses_pytest_raises: bool,
+    uses_random: bool,
+    has_random_seed: bool,
+    uses_subprocess: bool,
+    random_call_lines: Vec<usize>,
+    unguarded_subprocess_lines: Vec<usize>,
+}
+
+impl BodyScan {
+    fn of(body: Option<&tree_sitter::Node>, source: &[u8]) -> Self {
+        let mut scan = Self::default();
+        if let Some(b) = body {
+            walk_preorder(*b, |node| {
+                scan.visit(node, source);
+                true
+            });
+        }
+        scan
+    }
+
+    fn visit(&mut self, node: tree_sitter::Node, source: &[u8]) {
+        let k = kinds();
+        let kind = node.kind_id();
+        if kind == k.call {
+            if let Some(c) = Callee::of(node, source) {
+                self.uses_time_sleep |= c.is_time_sleep();
+                self.uses_file_io |= c.is_file_io();
+                self.uses_network |= c.is_network();
+                self.uses_cwd_dependency |= c.is_cwd();
+                // The module-qualified families are mutually exclusive by
+                // receiver, so one match picks the family. Call sites are
+                // recorded here, where each callee is already resolved, so
+                // the per-site rules never re-parse the module.
+                match c.object {
+                    // Any `random.*` call draws from the module-level generator.
+                    Some("random") => {
+                        self.uses_random = true;
+                        self.has_random_seed |= c.attribute == Some("seed");
+                        self.random_call_lines.push(node.start_position().row + 1);
+                    }
+                    // Every SUBPROCESS_FUNCTIONS entry is a `subprocess.*` call.
+                    Some("subprocess") => {
+                        self.uses_subprocess = true;
+                        if !call_has_timeout(node, source) {
+                            self.unguarded_subprocess_lines
+                                .push(node.start_position().row + 1);
+                        }
+                    }
+                    Some("pytest") => {
+                        self.uses_pytest_raises |= c.attribute == Some("raises");
+                    }
+                    _ => {}
+                }
+            }
+        } else if kind == k.assert_statement {
+            self.assertion_count += 1;
+        } else if kind == k.if_statement {
+            self.has_conditional_logic = true;
+        } else if kind == k.try_statement {
+            self.has_try_except = true;
+        }
+    }
+}
+
 /// Tree-sitter based Python test file parser that extracts test functions and fixtures.
 pub struct PythonParser {
     parser: Parser,
@@ -40,8 +439,17 @@ impl PythonParser {
             let root = tree.root_node();
             let source_bytes = source.as_bytes();
             let imports = Self::extract_imports(&root, source_bytes);
-            let test_functions = Self::extract_test_functions(&root, source_bytes, &file_path);
-            let fixtures = Self::extract_fixtures(&root, source_bytes, &file_path);
+            let functions = Self::collect_function_nodes(&root);
+            // Decorators are read once per function and shared by the test and
+            // fixture passes, which both classify every function.
+            let decorators: Vec<Vec<DecoratorInfo>> = functions
+                .iter()
+                .map(|f| Self::get_decorators(f, source_bytes))
+                .collect();
+            let test_functions =
+                Self::extract_test_functions(&functions, &decorators, source_bytes, &file_path);
+            let fixtures =
+                Self::extract_fixtures(&root, &functions, &decorators, source_bytes, &file_path);
             Ok(ParsedModule {
                 file_path,
                 source: source.to_string(),
@@ -68,6 +476,11 @@ impl PythonParser {
         node.utf8_text(source).unwrap_or_default().to_string()
     }
 
+    /// Borrow a node's source text without allocating; use for comparisons.
+    fn node_str<'s>(node: tree_sitter::Node, source: &'s [u8]) -> &'s str {
+        node.utf8_text(source).unwrap_or_default()
+    }
+
     fn extract_imports(root: &tree_sitter::Node, source: &[u8]) -> Vec<String> {
         let mut imports = Vec::new();
         let mut cursor = root.walk();
@@ -86,48 +499,43 @@ impl PythonParser {
     fn collect_function_nodes<'tree>(
         root: &'tree tree_sitter::Node<'tree>,
     ) -> Vec<tree_sitter::Node<'tree>> {
+        // Only module-level definitions are collected; class bodies are never
+        // descended into (see `test_class_definition_not_traversed`), so the
+        // scan stops at the first level instead of queueing class nodes.
         let mut nodes = Vec::new();
-        let mut to_visit = vec![*root];
-        while let Some(node) = to_visit.pop() {
-            let mut cursor = node.walk();
-            for child in node.children(&mut cursor) {
-                match child.kind() {
-                    "function_definition" => {
-                        nodes.push(child);
-                    }
-                    "decorated_definition" => {
-                        let mut inner = child.walk();
-                        for c in child.children(&mut inner) {
-                            match c.kind() {
-                                "function_definition" => nodes.push(c),
-                                "class_definition" => to_visit.push(c),
-                                _ => {}
-                            }
-                        }
-                    }
-                    "class_definition" => {
-                        to_visit.push(child);
-                    }
-                    _ => {}
+        let mut cursor = root.walk();
+        for child in root.children(&mut cursor) {
+            match child.kind() {
+                "function_definition" => nodes.push(child),
+                "decorated_definition" => {
+                    let mut inner = child.walk();
+                    nodes.extend(
+                        child
+                            .children(&mut inner)
+                            .filter(|c| c.kind() == "function_definition"),
+                    );
                 }
+                _ => {}
             }
         }
         nodes
     }
 
     fn extract_test_functions(
-        root: &tree_sitter::Node,
+        functions: &[tree_sitter::Node],
+        decorators: &[Vec<DecoratorInfo>],
         source: &[u8],
         file_path: &Path,
     ) -> Vec<TestFunction> {
         let mut tests = Vec::new();
-        for func_node in Self::collect_function_nodes(root) {
+        for (func_node, decorators) in functions.iter().zip(decorators) {
             let name_node = func_node.child_by_field_name("name");
             if let Some(nn) = name_node {
-                let name = Self::node_text(nn, source);
+                // Helpers and fixtures are skipped before any per-test work.
+                let name = Self::node_str(nn, source);
                 if name.starts_with("test_") {
                     tests.push(Self::build_test_function(
-                        &func_node, source, file_path, &name,
+                        func_node, decorators, source, file_path, name,
                     ));
                 }
             }
@@ -137,16 +545,17 @@ impl PythonParser {
 
     fn build_test_function(
         func_node: &tree_sitter::Node,
+        decorators: &[DecoratorInfo],
         source: &[u8],
         file_path: &Path,
         name: &str,
     ) -> TestFunction {
         let line = func_node.start_position().row + 1;
         let body = func_node.child_by_field_name("body");
-        let body_text = body.map(|b| Self::node_text(b, source)).unwrap_or_default();
+        // Borrowed once and shared by every text-based detector below.
+        let body_text = body.map(|b| Self::node_str(b, source)).unwrap_or_default();
 
-        let decorators = Self::get_decorators(func_node, source);
-        let parametrize_values = Self::extract_parametrize_values(&decorators, source);
+        let parametrize_values = Self::extract_parametrize_values(decorators, source);
 
         let is_async = {
             let mut cur = func_node.walk();
@@ -154,44 +563,45 @@ impl PythonParser {
             drop(cur);
             has_async
         };
-        let (is_parametrized, parametrize_count) = Self::detect_parametrize(&decorators);
-        let assertion_count = Self::count_assertions(body.as_ref());
+        let (is_parametrized, parametrize_count) = Self::detect_parametrize(decorators);
+        let scan = BodyScan::of(body.as_ref(), source);
+        let assertion_count = scan.assertion_count;
         let has_assertions = assertion_count > 0;
         let has_mock_verifications = body_text.contains(".assert_called")
             || body_text.contains(".called")
             || body_text.contains(".call_count");
-        let has_state_assertions = has_assertions && !has_mock_verifications_only(&body_text);
+        let has_state_assertions = has_assertions && !has_mock_verifications_only(body_text);
         let fixture_deps = Self::extract_fixture_deps(func_node, source);
-        let uses_time_sleep = Self::detect_time_sleep(body.as_ref(), source);
+        let uses_time_sleep = scan.uses_time_sleep;
         let sleep_value = Self::detect_sleep_value(body.as_ref(), source);
-        let uses_file_io = Self::detect_file_io(body.as_ref(), source);
-        let uses_network = Self::detect_network_usage(body.as_ref(), source);
-        let has_conditional_logic = Self::detect_conditionals(body.as_ref());
-        let has_try_except = Self::detect_try_except(body.as_ref());
+        let uses_file_io = scan.uses_file_io;
+        let uses_network = scan.uses_network;
+        let has_conditional_logic = scan.has_conditional_logic;
+        let has_try_except = scan.has_try_except;
         let docstring = Self::extract_docstring(func_node, source);
         let assertions = Self::extract_assertions(body.as_ref(), source);
-        let uses_cwd_dependency = Self::detect_cwd_dependency(body.as_ref(), source);
-        let uses_pytest_raises = Self::detect_pytest_raises(body.as_ref(), source);
+        let uses_cwd_dependency = scan.uses_cwd_dependency;
+        let uses_pytest_raises = scan.uses_pytest_raises;
         let mutates_fixture_deps =
             Self::detect_fixture_mutations(body.as_ref(), source, &fixture_deps);
-        let uses_random = Self::detect_random_usage(body.as_ref(), source);
-        let has_random_seed = Self::detect_random_seed(body.as_ref(), source);
-        let uses_subprocess = Self::detect_subprocess_usage(body.as_ref(), source);
+        let uses_random = scan.uses_random;
+        let has_random_seed = scan.has_random_seed;
+        let uses_subprocess = scan.uses_subprocess;
+        let random_call_lines = scan.random_call_lines;
+        let unguarded_subprocess_lines = scan.unguarded_subprocess_lines;
         let has_subprocess_timeout = Self::detect_subprocess_timeout(body.as_ref(), source);
-        let mocked_stdlib_targets =
-            Self::detect_stdlib_mock_targets(body.as_ref(), source, &decorators);
+        let patch_targets = Self::detect_all_patch_targets(body_text, decorators);
+        let mocked_stdlib_targets = Self::stdlib_mock_targets(&patch_targets);
         let mocks_stdlib_module = !mocked_stdlib_targets.is_empty();
         let (has_weak_assertions, weak_assertion_details) =
             Self::detect_weak_assertions(body.as_ref(), source);
-        let patch_targets = Self::detect_all_patch_targets(body.as_ref(), source, &decorators);
-        let (has_magic_mock, mock_count) = Self::detect_mock_usage(body.as_ref(), source);
-        let uses_shutil_copy = Self::detect_shutil_copy(body.as_ref(), source);
+        let (has_magic_mock, mock_count) = Self::detect_mock_usage(body_text);
+        let uses_shutil_copy = Self::detect_shutil_copy(body_text);
 
         let end_line = func_node.end_position().row + 1;
-        let body_hash = body.map(|b| {
-            let text = Self::node_text(b, source);
+        let body_hash = body.map(|_| {
             let mut hasher = std::collections::hash_map::DefaultHasher::new();
-            text.hash(&mut hasher);
+            body_text.hash(&mut hasher);
             hasher.finish()
         });
 
@@ -223,8 +633,10 @@ impl PythonParser {
             body_hash,
             uses_random,
             has_random_seed,
+            random_call_lines,
             uses_subprocess,
             has_subprocess_timeout,
+            unguarded_subprocess_lines,
             mocks_stdlib_module,
             mocked_stdlib_targets,
             has_weak_assertions,
@@ -238,7 +650,7 @@ impl PythonParser {
 
     fn get_decorators<'a>(
         func_node: &tree_sitter::Node<'a>,
-        source: &[u8],
+        source: &'a [u8],
     ) -> Vec<DecoratorInfo<'a>> {
         let mut decs = Vec::new();
         let parent = func_node.parent();
@@ -250,8 +662,26 @@ impl PythonParser {
         let mut cursor = container.walk();
         for child in container.children(&mut cursor) {
             if child.kind() == "decorator" {
+                let text = Self::node_str(child, source);
+                // The decorated name is read from the tree: the callee of a
+                // call decorator, otherwise the expression itself.
+                let name = match child.named_child(0) {
+                    Some(expr) if expr.kind_id() == kinds().call => expr
+                        .child_by_field_name("function")
+                        .map_or("", |f| Self::node_str(f, source)),
+                    Some(expr) => Self::node_str(expr, source),
+                    None => "",
+                };
+                let kind = match name {
+                    "pytest.mark.parametrize" | "mark.parametrize" | "parametrize" => {
+                        DecoratorKind::Parametrize
+                    }
+                    "pytest.fixture" | "fixture" => DecoratorKind::Fixture,
+                    _ => DecoratorKind::Other,
+                };
                 decs.push(DecoratorInfo {
-                    text: Self::node_text(child, source),
+                    text,
+                    kind,
                     node: Some(child),
                 });
             }
@@ -261,19 +691,12 @@ impl PythonParser {
 
     fn detect_parametrize(decorators: &[DecoratorInfo]) -> (bool, Option<usize>) {
         for dec in decorators {
-            let name = dec
-                .text
-                .trim_start_matches('@')
-                .split('(')
-                .next()
-                .unwrap_or("")
-                .trim();
-            if name == "pytest.mark.parametrize" || name == "parametrize" {
+            if dec.kind == DecoratorKind::Parametrize {
                 let count = dec.node.map_or_else(
-                    || Self::count_parametrize_args(&dec.text),
+                    || Self::count_parametrize_args(dec.text),
                     |node| {
                         Self::count_parametrize_args_ast(node)
-                            .unwrap_or_else(|| Self::count_parametrize_args(&dec.text))
+                            .unwrap_or_else(|| Self::count_parametrize_args(dec.text))
                     },
                 );
                 return (true, Some(count));
@@ -399,146 +822,98 @@ impl PythonParser {
         count
     }
 
-    fn count_assertions(body: Option<&tree_sitter::Node>) -> usize {
-        body.map_or(0, |b| {
-            let mut count = 0;
-            Self::count_assertions_recursive(*b, &mut count);
-            count
-        })
-    }
-
-    fn count_assertions_recursive(node: tree_sitter::Node, count: &mut usize) {
-        if node.kind() == "assert_statement" {
-            *count += 1;
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            Self::count_assertions_recursive(child, count);
-        }
-    }
-
-    fn detect_conditionals(body: Option<&tree_sitter::Node>) -> bool {
-        body.is_some_and(|b| Self::has_node_kind(*b, "if_statement"))
-    }
-
-    fn detect_try_except(body: Option<&tree_sitter::Node>) -> bool {
-        body.is_some_and(|b| Self::has_node_kind(*b, "try_statement"))
-    }
-
-    fn has_node_kind(node: tree_sitter::Node, kind: &str) -> bool {
-        if node.kind() == kind {
-            return true;
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_node_kind(child, kind) {
-                return true;
-            }
-        }
-        false
-    }
-
     fn extract_assertions(
         body: Option<&tree_sitter::Node>,
         source: &[u8],
     ) -> Vec<crate::models::AssertionInfo> {
-        body.map_or(vec![], |b| {
-            let mut infos = Vec::new();
-            Self::collect_assertion_info(*b, source, &mut infos);
-            infos
-        })
-    }
-
-    fn collect_assertion_info(
-        node: tree_sitter::Node,
-        source: &[u8],
-        infos: &mut Vec<crate::models::AssertionInfo>,
-    ) {
-        if node.kind() == "assert_statement" {
-            let line = node.start_position().row + 1;
-            let mut cursor = node.walk();
-            let expr_node = node.children(&mut cursor).find(|c| {
-                let k = c.kind();
-                !k.starts_with(',') && k != "comment" && k != "assert"
-            });
-            let expression_text = expr_node
-                .map(|n| Self::node_text(n, source))
-                .unwrap_or_default();
-            let has_comparison =
-                expr_node.is_some_and(|n| Self::has_node_kind_recursive(n, "comparison_operator"));
-            let is_magic = expr_node.is_some_and(|n| {
-                let kind = n.kind();
-                if kind == "true" || kind == "false" {
-                    return true;
-                }
-                if kind == "integer" {
-                    let text = Self::node_text(n, source);
-                    return text == "0" || text == "1";
+        let mut infos = Vec::new();
+        if let Some(b) = body {
+            let assert_kind = kinds().assert_statement;
+            walk_preorder(*b, |node| {
+                if node.kind_id() == assert_kind {
+                    infos.push(Self::assertion_info(node, source));
                 }
-                !has_comparison && kind == "identifier"
-            });
-            let is_suboptimal = expr_node.is_some_and(|n| Self::is_suboptimal_assertion(n, source));
-            infos.push(crate::models::AssertionInfo {
-                is_magic,
-                is_suboptimal,
-                has_comparison,
-                expression_text,
-                line,
+                true
             });
-            return;
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            Self::collect_assertion_info(child, source, infos);
         }
+        infos
     }
 
-    fn has_node_kind_recursive(node: tree_sitter::Node, kind: &str) -> bool {
-        if node.kind() == kind {
-            return true;
-        }
+    fn assertion_info(node: tree_sitter::Node, source: &[u8]) -> crate::models::AssertionInfo {
+        let line = node.start_position().row + 1;
         let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_node_kind_recursive(child, kind) {
-                return true;
+        let expr_node = node.children(&mut cursor).find(|c| {
+            let k = c.kind();
+            !k.starts_with(',') && k != "comment" && k != "assert"
+        });
+        let expression_text = expr_node
+            .map(|n| Self::node_text(n, source))
+            .unwrap_or_default();
+        // One switch on the expression kind: only a top-level comparison can
+        // be suboptimal, and literals and bare names are leaves, so only the
+        // remaining kinds need a subtree walk to find a nested comparison.
+        let comparison = kinds().comparison_operator;
+        let (has_comparison, is_magic, is_suboptimal) = match expr_node {
+            Some(n) if n.kind_id() == comparison => {
+                (true, false, Self::is_suboptimal_assertion(n, source))
             }
+            Some(n) => match n.kind() {
+                "true" | "false" | "identifier" => (false, true, false),
+                "integer" => (false, matches!(Self::node_str(n, source), "0" | "1"), false),
+                _ => (Self::has_node_kind_recursive(n, comparison), false, false),
+            },
+            None => (false, false, false),
+        };
+        crate::models::AssertionInfo {
+            is_magic,
+            is_suboptimal,
+            has_comparison,
+            expression_text,
+            line,
         }
-        false
+    }
+
+    fn has_node_kind_recursive(node: tree_sitter::Node, kind_id: u16) -> bool {
+        let mut found = false;
+        walk_preorder(node, |n| {
+            found = n.kind_id() == kind_id;
+            !found
+        });
+        found
     }
 
     fn is_suboptimal_assertion(expr: tree_sitter::Node, source: &[u8]) -> bool {
-        if expr.kind() == "comparison_operator" {
-            let mut cursor = expr.walk();
-            for child in expr.children(&mut cursor) {
-                if child.kind() == "is" || child.kind() == "is not" {
-                    return false;
-                }
-                if child.kind() == "call" {
-                    let func = child.child_by_field_name("function");
-                    if let Some(f) = func {
-                        let name = Self::node_text(f, source);
-                        if name == "len" || name == "type" {
-                            return true;
-                        }
-                    }
-                }
-                if child.kind() == "not" {
-                    let mut nc = child.walk();
-                    for inner in child.children(&mut nc) {
-                        if inner.kind() == "none" {
-                            return true;
-                        }
+        // Callers only pass `comparison_operator` nodes.
+        let mut cursor = expr.walk();
+        for child in expr.children(&mut cursor) {
+            if child.kind() == "is" || child.kind() == "is not" {
+                return false;
+            }
+            if child.kind() == "call" {
+                let func = child.child_by_field_name("function");
+                if let Some(f) = func {
+                    let name = Self::node_str(f, source);
+                    if name == "len" || name == "type" {
+                        return true;
                     }
                 }
-                if child.kind() == "none" {
-                    let text = Self::node_text(expr, source);
-                    // only consider it suboptimal if it's '== None' or '!= None', which is caught here
-                    // 'is not None' or 'is None' are returned false above.
-                    if text.contains("==") || text.contains("!=") || text.contains("not") {
+            }
+            if child.kind() == "not" {
+                let mut nc = child.walk();
+                for inner in child.children(&mut nc) {
+                    if inner.kind() == "none" {
                         return true;
                     }
                 }
             }
+            if child.kind() == "none" {
+                let text = Self::node_str(expr, source);
+                // only consider it suboptimal if it's '== None' or '!= None', which is caught here
+                // 'is not None' or 'is None' are returned false above.
+                if text.contains("==") || text.contains("!=") || text.contains("not") {
+                    return true;
+                }
+            }
         }
         false
     }
@@ -546,14 +921,7 @@ impl PythonParser {
     fn extract_parametrize_values(decorators: &[DecoratorInfo], source: &[u8]) -> Vec<Vec<String>> {
         let mut all_values = Vec::new();
         for dec in decorators {
-            let name = dec
-                .text
-                .trim_start_matches('@')
-                .split('(')
-                .next()
-                .unwrap_or("")
-                .trim();
-            if name != "pytest.mark.parametrize" && name != "parametrize" {
+            if dec.kind != DecoratorKind::Parametrize {
                 continue;
             }
             if let Some(node) = dec.node {
@@ -588,14 +956,16 @@ impl PythonParser {
                             }
                         }
                         if let Some(arg) = target_arg {
-                            let mut values = Vec::new();
+                            // Sized up front so generated parametrize tables
+                            // fill the vector without regrowing it.
+                            let mut values = Vec::with_capacity(arg.named_child_count());
                             let mut elem_cursor = arg.walk();
                             for elem in arg.children(&mut elem_cursor) {
                                 match elem.kind() {
                                     "," | "(" | ")" | "[" | "]" | "comment" => {}
                                     _ if !elem.is_extra() => {
                                         values
-                                            .push(Self::node_text(elem, source).trim().to_string());
+                                            .push(Self::node_str(elem, source).trim().to_string());
                                     }
                                     _ => {}
                                 }
@@ -609,129 +979,62 @@ impl PythonParser {
         None
     }
 
-    fn detect_cwd_dependency(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_cwd_call(*b, source))
-    }
-
-    fn has_cwd_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                if text == "os.getcwd" || text == "os.chdir" || text == "Path.cwd" {
-                    return true;
-                }
-                if text.contains("getcwd") || text.contains("chdir") {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let attr = f.child_by_field_name("attribute");
-                    if let Some(a) = attr {
-                        let name = Self::node_text(a, source);
-                        if name == "getcwd" || name == "chdir" {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_cwd_call(child, source) {
-                return true;
-            }
-        }
-        false
-    }
-
-    fn detect_pytest_raises(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_pytest_raises(*b, source))
-    }
-
-    fn has_pytest_raises(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                if f.kind() == "attribute" {
-                    let text = Self::node_text(f, source);
-                    if text == "pytest.raises" {
-                        return true;
-                    }
-                    let attr = f.child_by_field_name("attribute");
-                    let obj = f.child_by_field_name("object");
-                    if let (Some(a), Some(o)) = (attr, obj) {
-                        let name = Self::node_text(a, source);
-                        let obj_name = Self::node_text(o, source);
-                        if name == "raises" && obj_name == "pytest" {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_pytest_raises(child, source) {
-                return true;
-            }
-        }
-        false
-    }
-
     fn detect_fixture_mutations(
         body: Option<&tree_sitter::Node>,
         source: &[u8],
         fixture_deps: &[String],
     ) -> Vec<String> {
+        // Every mutation is reported against a fixture argument, so a test
+        // without any has nothing to find.
+        if fixture_deps.is_empty() {
+            return Vec::new();
+        }
+        // Names are borrowed from the source while scanning; only the
+        // deduplicated set is copied out.
         let mut mutated = Vec::new();
         if let Some(b) = body {
             Self::find_mutations(*b, source, fixture_deps, &mut mutated);
         }
-        mutated.sort();
+        mutated.sort_unstable();
         mutated.dedup();
-        mutated
+        mutated.into_iter().map(str::to_string).collect()
     }
 
-    fn find_mutations(
+    fn find_mutations<'s>(
         node: tree_sitter::Node,
-        source: &[u8],
+        source: &'s [u8],
         fixture_deps: &[String],
-        mutated: &mut Vec<String>,
+        mutated: &mut Vec<&'s str>,
     ) {
-        if node.kind() == "call" {
+        if node.kind_id() == kinds().call {
             let func = node.child_by_field_name("function");
             if let Some(f) = func {
-                if f.kind() == "attribute" {
+                if f.kind_id() == kinds().attribute {
                     let obj = f.child_by_field_name("object");
                     let attr = f.child_by_field_name("attribute");
                     if let (Some(obj), Some(attr)) = (obj, attr) {
-                        let obj_name = Self::node_text(obj, source);
-                        let method = Self::node_text(attr, source);
-                        let mutating_methods = [
-                            "append", "extend", "remove", "pop", "clear", "update", "insert",
-                            "add", "discard",
-                        ];
-                        if mutating_methods.contains(&method.as_str())
-                            && (fixture_deps.contains(&obj_name)
-                                || Self::is_fixture_chain(&obj, source, fixture_deps))
-                        {
-                            mutated.push(Self::get_fixture_root(&obj, source, fixture_deps));
+                        let method = Self::node_str(attr, source);
+                        if MUTATING_METHODS.contains(&method) {
+                            if let Some(root) = Self::fixture_chain_root(obj, source, fixture_deps)
+                            {
+                                mutated.push(root);
+                            }
                         }
                     }
                 }
             }
         }
-        if node.kind() == "assignment" {
+        if node.kind_id() == kinds().assignment {
             let target = node.child_by_field_name("left");
             if let Some(t) = target {
                 Self::check_assignment_target(t, source, fixture_deps, mutated);
             }
         }
-        if node.kind() == "delete_statement" {
+        if node.kind_id() == kinds().delete_statement {
             let mut cursor = node.walk();
             for child in node.children(&mut cursor) {
-                let text = Self::node_text(child, source).trim().to_string();
-                if fixture_deps.contains(&text) {
+                let text = Self::node_str(child, source).trim();
+                if fixture_deps.iter().any(|d| d == text) {
                     mutated.push(text);
                 }
             }
@@ -742,93 +1045,48 @@ impl PythonParser {
         }
     }
 
-    fn check_assignment_target(
+    fn check_assignment_target<'s>(
         target: tree_sitter::Node,
-        source: &[u8],
+        source: &'s [u8],
         fixture_deps: &[String],
-        mutated: &mut Vec<String>,
+        mutated: &mut Vec<&'s str>,
     ) {
-        if target.kind() == "subscript" {
-            let value = target.child_by_field_name("value");
-            if let Some(v) = value {
-                let name = Self::node_text(v, source);
-                if fixture_deps.contains(&name) {
-                    mutated.push(name);
-                } else if Self::is_fixture_chain(&v, source, fixture_deps) {
-                    mutated.push(Self::get_fixture_root(&v, source, fixture_deps));
-                }
-            }
-        }
-        if target.kind() == "attribute" {
-            let obj = target.child_by_field_name("object");
-            if let Some(o) = obj {
-                let name = Self::node_text(o, source);
-                if fixture_deps.contains(&name) {
-                    mutated.push(name);
-                } else if Self::is_fixture_chain(&o, source, fixture_deps) {
-                    mutated.push(Self::get_fixture_root(&o, source, fixture_deps));
-                }
-            }
-        }
-    }
-
-    /// Check if an attribute chain's root is a fixture dependency.
-    fn is_fixture_chain(node: &tree_sitter::Node, source: &[u8], fixture_deps: &[String]) -> bool {
-        let mut current = *node;
-        loop {
-            if current.kind() == "identifier" {
-                let name = Self::node_text(current, source);
-                return fixture_deps.contains(&name);
-            }
-            if current.kind() == "attribute" {
-                if let Some(obj) = current.child_by_field_name("object") {
-                    current = obj;
-                } else {
-                    return false;
-                }
-            } else if current.kind() == "subscript" {
-                if let Some(val) = current.child_by_field_name("value") {
-                    current = val;
-                } else {
-                    return false;
-                }
-            } else {
-                return false;
-            }
+        let k = kinds();
+        let base = if target.kind_id() == k.subscript {
+            target.child_by_field_name("value")
+        } else if target.kind_id() == k.attribute {
+            target.child_by_field_name("object")
+        } else {
+            None
+        };
+        if let Some(root) = base.and_then(|b| Self::fixture_chain_root(b, source, fixture_deps)) {
+            mutated.push(root);
         }
     }
 
-    /// Get the root fixture name from an attribute chain.
-    fn get_fixture_root(
-        node: &tree_sitter::Node,
-        source: &[u8],
+    /// Follow an attribute/subscript chain down to its root identifier and
+    /// return it if it names a fixture dependency.
+    fn fixture_chain_root<'s>(
+        node: tree_sitter::Node,
+        source: &'s [u8],
         fixture_deps: &[String],
-    ) -> String {
-        let mut current = *node;
+    ) -> Option<&'s str> {
+        let mut current = node;
         loop {
-            if current.kind() == "identifier" {
-                let name = Self::node_text(current, source);
-                if fixture_deps.contains(&name) {
-                    return name;
-                }
-            }
-            if current.kind() == "attribute" {
-                if let Some(obj) = current.child_by_field_name("object") {
-                    current = obj;
-                } else {
-                    break;
-                }
-            } else if current.kind() == "subscript" {
-                if let Some(val) = current.child_by_field_name("value") {
-                    current = val;
-                } else {
-                    break;
-                }
+            let k = kinds();
+            let kind = current.kind_id();
+            let next = if kind == k.identifier {
+                let name = Self::node_str(current, source);
+                return fixture_deps.iter().any(|d| d == name).then_some(name);
+            } else if kind == k.attribute {
+                current.child_by_field_name("object")
+            } else if kind == k.subscript {
+                current.child_by_field_name("value")
             } else {
-                break;
-            }
+                None
+            };
+            current = next?;
         }
-        String::new()
     }
 
     fn extract_docstring(func_node: &tree_sitter::Node, source: &[u8]) -> Option<String> {
@@ -848,58 +1106,48 @@ impl PythonParser {
     }
 
     fn extract_fixture_deps(func_node: &tree_sitter::Node, source: &[u8]) -> Vec<String> {
-        let mut deps = Vec::new();
-        let params = func_node.child_by_field_name("parameters");
-        if let Some(p) = params {
-            let mut cursor = p.walk();
-            for child in p.children(&mut cursor) {
-                let name = match child.kind() {
-                    "identifier" => Some(Self::node_text(child, source)),
-                    "typed_parameter" | "default_parameter" | "typed_default_parameter" => child
-                        .child_by_field_name("name")
-                        .map(|n| Self::node_text(n, source)),
-                    _ => None,
-                };
-                if let Some(name) = name {
-                    if !["self", "cls"].contains(&name.as_str()) {
-                        deps.push(name);
-                    }
-                }
-            }
-        }
-        deps
+        let params = match func_node.child_by_field_name("parameters") {
+            Some(p) => p,
+            None => return Vec::new(),
+        };
+        let mut cursor = params.walk();
+        params
+            .children(&mut cursor)
+            .filter_map(|child| match child.kind() {
+                "identifier" => Some(Self::node_str(child, source)),
+                "typed_parameter" | "default_parameter" | "typed_default_parameter" => child
+                    .child_by_field_name("name")
+                    .map(|n| Self::node_str(n, source)),
+                _ => None,
+            })
+            .filter(|name| !IGNORED_PARAMS.contains(name))
+            .map(str::to_string)
+            .collect()
     }
 
-    fn extract_fixtures(root: &tree_sitter::Node, source: &[u8], file_path: &Path) -> Vec<Fixture> {
+    fn extract_fixtures(
+        root: &tree_sitter::Node,
+        functions: &[tree_sitter::Node],
+        decorators: &[Vec<DecoratorInfo>],
+        source: &[u8],
+        file_path: &Path,
+    ) -> Vec<Fixture> {
         let mut fixtures = Vec::new();
-        let frozen_classes = Self::detect_frozen_dataclass_names(root, source);
-
-        for func_node in Self::collect_function_nodes(root) {
-            let decorators = Self::get_decorators(&func_node, source);
-            let is_fixture = decorators.iter().any(|d| {
-                let name = d
-                    .text
-                    .trim_start_matches('@')
-                    .split('(')
-                    .next()
-                    .unwrap_or("")
-                    .trim();
-                name == "pytest.fixture" || name == "fixture"
-            });
+        // Only needed to judge fixture returns, so modules without fixtures
+        // never scan for frozen dataclasses.
+        let mut frozen_classes = None;
 
-            if is_fixture {
+        for (func_node, decorators) in functions.iter().zip(decorators) {
+            let fixture_dec = decorators.iter().find(|d| d.kind == DecoratorKind::Fixture);
+
+            if let Some(dec) = fixture_dec {
                 let name_node = func_node.child_by_field_name("name");
                 if let Some(nn) = name_node {
                     let name = Self::node_text(nn, source);
-                    let dec_texts: Vec<String> =
-                        decorators.iter().map(|d| d.text.clone()).collect();
+                    let frozen = frozen_classes
+                        .get_or_insert_with(|| Self::detect_frozen_dataclass_names(root, source));
                     fixtures.push(Self::build_fixture(
-                        &func_node,
-                        source,
-                        file_path,
-                        &name,
-                        &dec_texts,
-                        &frozen_classes,
+                        func_node, source, file_path, &name, dec, frozen,
                     ));
                 }
             }
@@ -912,23 +1160,22 @@ impl PythonParser {
         source: &[u8],
         file_path: &Path,
         name: &str,
-        decorators: &[String],
+        fixture_dec: &DecoratorInfo,
         frozen_classes: &HashSet<String>,
     ) -> Fixture {
         let line = func_node.start_position().row + 1;
         let body = func_node.child_by_field_name("body");
 
-        let scope = Self::extract_fixture_scope(decorators);
-        let is_autouse = decorators
-            .iter()
-            .any(|d| d.contains("autouse") && d.contains("True"));
+        let (scope, is_autouse) = Self::extract_fixture_options(fixture_dec, source);
         let dependencies = Self::extract_fixture_deps(func_node, source);
-        let returns_mutable = Self::detect_mutable_return(body.as_ref(), source, frozen_classes);
-        let has_yield = Self::detect_yield(body.as_ref());
-        let has_db_commit = Self::detect_db_commit(body.as_ref(), source);
-        let has_db_rollback = Self::detect_db_rollback(body.as_ref(), source);
-        let has_cleanup = has_db_rollback || Self::detect_cleanup_pattern(body.as_ref(), source);
-        let uses_file_io = Self::detect_file_io(body.as_ref(), source);
+        let scan = FixtureBodyScan::of(body.as_ref(), source, frozen_classes);
+        let returns_mutable = scan.returns_mutable;
+        let has_yield = scan.has_yield;
+        let has_db_commit = scan.has_db_commit;
+        let has_db_rollback = scan.has_db_rollback;
+        let has_cleanup =
+            has_db_rollback || Self::detect_cleanup_pattern(body.as_ref(), source, has_yield);
+        let uses_file_io = scan.uses_file_io;
 
         Fixture {
             name: name.to_string(),
@@ -943,92 +1190,52 @@ impl PythonParser {
             has_db_rollback,
             has_cleanup,
             uses_file_io,
-            used_by: vec![],
-        }
-    }
-
-    fn extract_fixture_scope(decorators: &[String]) -> FixtureScope {
-        for dec in decorators {
-            if dec.contains("scope") {
-                if dec.contains("\"session\"") || dec.contains("'session'") {
-                    return FixtureScope::Session;
-                }
-                if dec.contains("\"package\"") || dec.contains("'package'") {
-                    return FixtureScope::Package;
-                }
-                if dec.contains("\"module\"") || dec.contains("'module'") {
-                    return FixtureScope::Module;
-                }
-                if dec.contains("\"class\"") || dec.contains("'class'") {
-                    return FixtureScope::Class;
-                }
-            }
         }
-        FixtureScope::Function
-    }
-
-    fn detect_file_io(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_file_io_call(*b, source))
     }
 
-    fn has_file_io_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let name = Self::node_text(f, source);
-                if ["open", "read", "write"].contains(&name.as_str()) {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let attr = f.child_by_field_name("attribute");
-                    if let Some(a) = attr {
-                        let attr_name = Self::node_text(a, source);
-                        if ["read", "write", "open"].contains(&attr_name.as_str()) {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_file_io_call(child, source) {
-                return true;
+    /// Reads `scope=` and `autouse=` from the fixture decorator's keyword
+    /// arguments instead of substring-matching the decorator text.
+    fn extract_fixture_options(dec: &DecoratorInfo, source: &[u8]) -> (FixtureScope, bool) {
+        let mut scope = FixtureScope::Function;
+        let mut is_autouse = false;
+        let args = dec
+            .node
+            .and_then(|n| n.named_child(0))
+            .filter(|c| c.kind() == "call")
+            .and_then(|c| c.child_by_field_name("arguments"));
+        let args = match args {
+            Some(a) => a,
+            None => return (scope, is_autouse),
+        };
+        let mut cursor = args.walk();
+        for kw in args.named_children(&mut cursor) {
+            if kw.kind() != "keyword_argument" {
+                continue;
             }
-        }
-        false
-    }
-
-    fn detect_time_sleep(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_time_sleep_call(*b, source))
-    }
-
-    fn has_time_sleep_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                if text == "time.sleep" || text == "sleep" {
-                    return true;
+            let (key, value) = match (
+                kw.child_by_field_name("name"),
+                kw.child_by_field_name("value"),
+            ) {
+                (Some(k), Some(v)) => (k, v),
+                _ => continue,
+            };
+            match Self::node_str(key, source) {
+                "scope" => {
+                    let literal =
+                        Self::node_str(value, source).trim_matches(|c| c == '"' || c == '\'');
+                    scope = match literal {
+                        "session" => FixtureScope::Session,
+                        "package" => FixtureScope::Package,
+                        "module" => FixtureScope::Module,
+                        "class" => FixtureScope::Class,
+                        _ => FixtureScope::Function,
+                    };
                 }
-                if f.kind() == "attribute" {
-                    let attr = f.child_by_field_name("attribute");
-                    if let Some(a) = attr {
-                        let name = Self::node_text(a, source);
-                        if name == "sleep" {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_time_sleep_call(child, source) {
-                return true;
+                "autouse" => is_autouse = value.kind() == "true",
+                _ => {}
             }
         }
-        false
+        (scope, is_autouse)
     }
 
     fn detect_sleep_value(body: Option<&tree_sitter::Node>, source: &[u8]) -> Option<f64> {
@@ -1039,7 +1246,7 @@ impl PythonParser {
         if let Some(arg) = node.child_by_field_name("arguments") {
             for child in arg.children(&mut arg.walk()) {
                 if child.kind() == "integer" || child.kind() == "float" {
-                    let val_str = Self::node_text(child, source);
+                    let val_str = Self::node_str(child, source);
                     if let Ok(val) = val_str.parse::<f64>() {
                         return Some(val);
                     }
@@ -1049,7 +1256,7 @@ impl PythonParser {
                         .map(|op| Self::node_text(op, source));
                     if op.as_deref() == Some("-") {
                         if let Some(operand) = child.child_by_field_name("argument") {
-                            let val_str = Self::node_text(operand, source);
+                            let val_str = Self::node_str(operand, source);
                             if let Ok(val) = val_str.parse::<f64>() {
                                 return Some(-val);
                             }
@@ -1062,13 +1269,13 @@ impl PythonParser {
     }
 
     fn is_sleep_call(func: tree_sitter::Node, source: &[u8]) -> bool {
-        let text = Self::node_text(func, source);
+        let text = Self::node_str(func, source);
         if text == "time.sleep" || text == "sleep" {
             return true;
         }
         if func.kind() == "attribute" {
             if let Some(attr) = func.child_by_field_name("attribute") {
-                let name = Self::node_text(attr, source);
+                let name = Self::node_str(attr, source);
                 if name == "sleep" {
                     return true;
                 }
@@ -1080,7 +1287,7 @@ impl PythonParser {
     fn find_sleep_value(node: tree_sitter::Node, source: &[u8]) -> Option<f64> {
         let mut max_val: Option<f64> = None;
 
-        if node.kind() == "call" {
+        if node.kind_id() == kinds().call {
             if let Some(func) = node.child_by_field_name("function") {
                 if Self::is_sleep_call(func, source) {
                     if let Some(val) = Self::extract_sleep_arg(node, source) {
@@ -1104,154 +1311,41 @@ impl PythonParser {
         max_val
     }
 
-    fn detect_cleanup_pattern(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        let cleanup_text_patterns = [
-            ".close()",
-            ".teardown_",
-            "env_reset",
-            ".restore()",
-            ".cleanup()",
-            ".remove()",
-            ".unlink()",
-        ];
+    fn detect_cleanup_pattern(
+        body: Option<&tree_sitter::Node>,
+        source: &[u8],
+        has_yield: bool,
+    ) -> bool {
         body.is_some_and(|b| {
-            let text = String::from_utf8_lossy(&source[b.start_byte()..b.end_byte()]);
-
-            if cleanup_text_patterns.iter().any(|p| text.contains(p)) {
-                return true;
-            }
-
-            if text.contains("addfinalizer") || text.contains("request.addfinalizer") {
-                return true;
-            }
-
-            if text.contains("mock.patch") || text.contains("patch(") {
-                return true;
-            }
-
-            if text.contains("tmp_path") || text.contains("tmpdir") {
-                return true;
-            }
-
-            if Self::has_try_wrapping_yield(*b, source) {
+            // The wrapping checks only look at top-level statements, so run
+            // them before scanning the body text.
+            if has_yield && Self::has_guarded_yield(*b) {
                 return true;
             }
-
-            if Self::has_with_wrapping_yield(*b, source) {
-                return true;
-            }
-
-            false
+            let text = Self::node_str(*b, source);
+            CLEANUP_TEXT_PATTERNS.iter().any(|p| text.contains(p))
         })
     }
 
-    fn has_try_wrapping_yield(body: tree_sitter::Node, _source: &[u8]) -> bool {
-        let mut cursor = body.walk();
-        for child in body.children(&mut cursor) {
-            if child.kind() == "try_statement" {
-                let mut try_cursor = child.walk();
-                for try_child in child.children(&mut try_cursor) {
-                    if (try_child.kind() == "block" || try_child.kind() == "suite")
-                        && Self::has_node_kind_recursive(try_child, "yield")
-                    {
-                        return true;
-                    }
-                }
-            }
-        }
-        false
-    }
-
-    fn has_with_wrapping_yield(body: tree_sitter::Node, _source: &[u8]) -> bool {
+    /// Whether a top-level `try` body or `with` block yields, i.e. teardown
+    /// runs around the yield. Both statement kinds are checked in one pass
+    /// over the fixture's statements.
+    fn has_guarded_yield(body: tree_sitter::Node) -> bool {
+        let yield_kind = kinds().yield_expr;
         let mut cursor = body.walk();
-        for child in body.children(&mut cursor) {
-            if child.kind() == "with_statement" && Self::has_node_kind_recursive(child, "yield") {
-                return true;
-            }
-        }
-        false
-    }
-
-    fn detect_network_usage(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_network_call(*b, source))
-    }
-
-    fn has_network_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                let network_libs = ["requests", "socket", "httpx", "aiohttp", "urllib"];
-                if network_libs.iter().any(|lib| {
-                    text.starts_with(&format!("{}.", lib))
-                        || text.starts_with(&format!("{} (", lib))
-                }) {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let obj = f.child_by_field_name("object");
-                    if let Some(o) = obj {
-                        let obj_name = Self::node_text(o, source);
-                        if network_libs.contains(&obj_name.as_str()) {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_network_call(child, source) {
-                return true;
-            }
-        }
-        false
-    }
-
-    fn detect_yield(body: Option<&tree_sitter::Node>) -> bool {
-        body.is_some_and(|b| Self::has_node_kind_recursive(*b, "yield"))
-    }
-
-    fn detect_db_commit(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_db_call(*b, source, "commit"))
-    }
-
-    fn detect_db_rollback(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_db_call(*b, source, "rollback"))
-    }
-
-    fn has_db_call(node: tree_sitter::Node, source: &[u8], method_name: &str) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                if text.to_lowercase().contains(method_name) {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let attr = f.child_by_field_name("attribute");
-                    if let Some(a) = attr {
-                        let name = Self::node_text(a, source).to_lowercase();
-                        if name == method_name {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        if node.kind() == "identifier" {
-            let name = Self::node_text(node, source).to_lowercase();
-            if name == method_name {
-                return true;
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_db_call(child, source, method_name) {
-                return true;
+        let found = body.children(&mut cursor).any(|stmt| match stmt.kind() {
+            "try_statement" => {
+                let mut try_cursor = stmt.walk();
+                let found = stmt.children(&mut try_cursor).any(|c| {
+                    (c.kind() == "block" || c.kind() == "suite")
+                        && Self::has_node_kind_recursive(c, yield_kind)
+                });
+                found
             }
-        }
-        false
+            "with_statement" => Self::has_node_kind_recursive(stmt, yield_kind),
+            _ => false,
+        });
+        found
     }
 
     fn detect_frozen_dataclass_names(root: &tree_sitter::Node, source: &[u8]) -> HashSet<String> {
@@ -1268,53 +1362,23 @@ impl PythonParser {
                         "decorator" => {
                             decorators_text.push(Self::node_text(c, source));
                         }
-                        _ => {}
-                    }
-                }
-                if let Some(cls) = class_node {
-                    let is_frozen = decorators_text.iter().any(|d| {
-                        (d.contains("dataclass") && d.contains("frozen") && d.contains("True"))
-                            || d.contains("@frozen")
-                    });
-                    if is_frozen {
-                        if let Some(name_node) = cls.child_by_field_name("name") {
-                            frozen.insert(Self::node_text(name_node, source));
-                        }
-                    }
-                }
-            }
-        }
-        frozen
-    }
-
-    fn detect_mutable_return(
-        body: Option<&tree_sitter::Node>,
-        source: &[u8],
-        frozen_classes: &HashSet<String>,
-    ) -> bool {
-        body.is_some_and(|b| Self::has_mutable_return_in_body(*b, source, frozen_classes))
-    }
-
-    fn has_mutable_return_in_body(
-        node: tree_sitter::Node,
-        source: &[u8],
-        frozen_classes: &HashSet<String>,
-    ) -> bool {
-        if node.kind() == "return_statement" {
-            let mut cursor = node.walk();
-            for child in node.children(&mut cursor) {
-                if Self::is_mutable_node(child, source, frozen_classes) {
-                    return true;
+                        _ => {}
+                    }
+                }
+                if let Some(cls) = class_node {
+                    let is_frozen = decorators_text.iter().any(|d| {
+                        (d.contains("dataclass") && d.contains("frozen") && d.contains("True"))
+                            || d.contains("@frozen")
+                    });
+                    if is_frozen {
+                        if let Some(name_node) = cls.child_by_field_name("name") {
+                            frozen.insert(Self::node_text(name_node, source));
+                        }
+                    }
                 }
             }
         }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_mutable_return_in_body(child, source, frozen_classes) {
-                return true;
-            }
-        }
-        false
+        frozen
     }
 
     fn is_mutable_node(
@@ -1327,75 +1391,24 @@ impl PythonParser {
             "call" => {
                 let func = node.child_by_field_name("function");
                 if let Some(f) = func {
-                    let name = Self::node_text(f, source);
+                    let name = Self::node_str(f, source);
                     // Known immutable constructors
-                    let immutable_constructors = [
-                        "int",
-                        "str",
-                        "float",
-                        "bool",
-                        "bytes",
-                        "complex",
-                        "tuple",
-                        "frozenset",
-                        "NoneType",
-                        "Path",
-                        "PurePath",
-                        "PurePosixPath",
-                        "PureWindowsPath",
-                        "Decimal",
-                        "date",
-                        "datetime",
-                        "time",
-                        "timedelta",
-                        "UUID",
-                        "ipaddress",
-                        "IPv4Address",
-                        "IPv6Address",
-                        "re.compile",
-                        "enum",
-                    ];
-                    if immutable_constructors.iter().any(|ic| name == *ic) {
+                    if IMMUTABLE_CONSTRUCTORS.iter().any(|ic| name == *ic) {
                         return false;
                     }
                     // Known mutable constructors
-                    let mutable_constructors = [
-                        "list",
-                        "dict",
-                        "set",
-                        "bytearray",
-                        "deque",
-                        "defaultdict",
-                        "Counter",
-                        "OrderedDict",
-                    ];
-                    if mutable_constructors.iter().any(|mc| name == *mc) {
+                    if MUTABLE_CONSTRUCTORS.iter().any(|mc| name == *mc) {
                         return true;
                     }
-                    // Class instance constructor: uppercase first letter = class convention
-                    if let Some(first_char) = name.chars().next() {
-                        if first_char.is_uppercase() {
-                            // Check if it's a frozen dataclass
-                            let class_name = name.split('.').last().unwrap_or(&name);
-                            if frozen_classes.contains(class_name) {
-                                return false;
-                            }
-                            return true;
-                        }
-                    }
-                    // Check for attribute access like module.Class()
-                    if f.kind() == "attribute" {
-                        if let Some(attr) = f.child_by_field_name("attribute") {
-                            let attr_name = Self::node_text(attr, source);
-                            if let Some(first_char) = attr_name.chars().next() {
-                                if first_char.is_uppercase() {
-                                    if frozen_classes.contains(attr_name.as_str()) {
-                                        return false;
-                                    }
-                                    return true;
-                                }
-                            }
-                        }
+                    // Class instance constructor: uppercase first letter = class
+                    // convention, either on the bare name or on the attribute
+                    // of `module.Class()`. Either way the class is the last
+                    // dotted segment, so one reverse split covers both.
+                    let class_name = name.rsplit('.').next().unwrap_or(name);
+                    let is_class = name.starts_with(char::is_uppercase)
+                        || (f.kind() == "attribute" && class_name.starts_with(char::is_uppercase));
+                    if is_class {
+                        return !frozen_classes.contains(class_name);
                     }
                 }
                 false
@@ -1404,154 +1417,17 @@ impl PythonParser {
         }
     }
 
-    fn detect_random_usage(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_random_call(*b, source))
-    }
-
-    fn has_random_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                let random_fns = [
-                    "random.random",
-                    "random.randint",
-                    "random.choice",
-                    "random.shuffle",
-                    "random.uniform",
-                    "random.randrange",
-                    "random.sample",
-                    "random.gauss",
-                    "random.normalvariate",
-                ];
-                if random_fns.iter().any(|rf| text == *rf) {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let obj = f.child_by_field_name("object");
-                    if let Some(o) = obj {
-                        let obj_name = Self::node_text(o, source);
-                        if obj_name == "random" {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_random_call(child, source) {
-                return true;
-            }
-        }
-        false
-    }
-
-    fn detect_random_seed(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_random_seed_call(*b, source))
-    }
-
-    fn has_random_seed_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                if text == "random.seed" {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let attr = f.child_by_field_name("attribute");
-                    let obj = f.child_by_field_name("object");
-                    if let (Some(a), Some(o)) = (attr, obj) {
-                        let attr_name = Self::node_text(a, source);
-                        let obj_name = Self::node_text(o, source);
-                        if attr_name == "seed" && obj_name == "random" {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_random_seed_call(child, source) {
-                return true;
-            }
-        }
-        false
-    }
-
-    fn detect_subprocess_usage(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        body.is_some_and(|b| Self::has_subprocess_call(*b, source))
-    }
-
-    fn has_subprocess_call(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
-            let func = node.child_by_field_name("function");
-            if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                let subprocess_fns = [
-                    "subprocess.Popen",
-                    "subprocess.run",
-                    "subprocess.call",
-                    "subprocess.check_output",
-                    "subprocess.check_call",
-                ];
-                if subprocess_fns.iter().any(|sf| text == *sf) {
-                    return true;
-                }
-                if f.kind() == "attribute" {
-                    let obj = f.child_by_field_name("object");
-                    if let Some(o) = obj {
-                        let obj_name = Self::node_text(o, source);
-                        if obj_name == "subprocess" {
-                            return true;
-                        }
-                    }
-                }
-            }
-        }
-        let mut cursor = node.walk();
-        for child in node.children(&mut cursor) {
-            if Self::has_subprocess_call(child, source) {
-                return true;
-            }
-        }
-        false
-    }
-
     fn detect_subprocess_timeout(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
         body.is_some_and(|b| Self::has_timeout_arg(*b, source))
     }
 
     fn has_timeout_arg(node: tree_sitter::Node, source: &[u8]) -> bool {
-        if node.kind() == "call" {
+        if node.kind_id() == kinds().call {
             let func = node.child_by_field_name("function");
             if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                let subprocess_fns = [
-                    "subprocess.Popen",
-                    "subprocess.run",
-                    "subprocess.call",
-                    "subprocess.check_output",
-                    "subprocess.check_call",
-                ];
-                if subprocess_fns.iter().any(|sf| text == *sf) {
-                    let args = node.child_by_field_name("arguments");
-                    if let Some(a) = args {
-                        let mut cursor = a.walk();
-                        for child in a.children(&mut cursor) {
-                            if child.kind() == "keyword_argument" {
-                                let name = child.child_by_field_name("name");
-                                if let Some(n) = name {
-                                    if Self::node_text(n, source) == "timeout" {
-                                        return false;
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    return true;
+                let text = Self::node_str(f, source);
+                if SUBPROCESS_FUNCTIONS.iter().any(|sf| text == *sf) {
+                    return !call_has_timeout(node, source);
                 }
             }
         }
@@ -1576,18 +1452,11 @@ impl PythonParser {
     }
 
     fn collect_weak_assertions(node: tree_sitter::Node, source: &[u8], details: &mut Vec<String>) {
-        if node.kind() == "call" {
+        if node.kind_id() == kinds().call {
             let func = node.child_by_field_name("function");
             if let Some(f) = func {
-                let text = Self::node_text(f, source);
-                let weak_patterns: &[(&str, &str)] = &[
-                    ("assertIsInstance", "type-only assertion"),
-                    ("isinstance", "type-only assertion"),
-                    ("assertTrue", "existence-only assertion"),
-                    ("assertIsNotNone", "existence-only assertion"),
-                    ("assertIn", "key-presence-only assertion"),
-                ];
-                for (pattern, category) in weak_patterns {
+                let text = Self::node_str(f, source);
+                for (pattern, category) in WEAK_ASSERTION_PATTERNS {
                     if text.contains(pattern) {
                         let already = details.iter().any(|d| d == *category);
                         if !already {
@@ -1597,7 +1466,7 @@ impl PythonParser {
                 }
             }
         }
-        if node.kind() == "comparison_operator" {
+        if node.kind_id() == kinds().comparison_operator {
             let mut cursor = node.walk();
             let children: Vec<_> = node.children(&mut cursor).collect();
             let ops: Vec<String> = children
@@ -1617,9 +1486,9 @@ impl PythonParser {
                 }
             }
             for (i, child) in children.iter().enumerate() {
-                let text = Self::node_text(*child, source);
+                let text = Self::node_str(*child, source);
                 if text == "type" && i + 1 < children.len() {
-                    let next_text = Self::node_text(children[i + 1], source);
+                    let next_text = Self::node_str(children[i + 1], source);
                     if next_text == "==" || next_text == "is" {
                         details.push("type-only assertion".to_string());
                     }
@@ -1632,11 +1501,8 @@ impl PythonParser {
         }
     }
 
-    fn detect_stdlib_mock_targets(
-        body: Option<&tree_sitter::Node>,
-        source: &[u8],
-        decorators: &[DecoratorInfo],
-    ) -> Vec<String> {
+    /// Patch targets that point into the standard library, in first-seen order.
+    fn stdlib_mock_targets(patch_targets: &[String]) -> Vec<String> {
         const STDLIB_MODULES: &[&str] = &[
             "subprocess",
             "os",
@@ -1663,98 +1529,39 @@ impl PythonParser {
             "asyncio",
         ];
 
-        let mut targets = Vec::new();
-
-        // Check @patch decorators
-        for dec in decorators {
-            if let Some(target) = extract_patch_target(&dec.text) {
-                if STDLIB_MODULES.iter().any(|m| target.starts_with(m))
-                    && !targets.contains(&target)
-                {
-                    targets.push(target);
-                }
-            }
-        }
-
-        // Check patch() calls in body
-        if let Some(body_node) = body {
-            let body_text = Self::node_text(*body_node, source);
-            for cap in body_text.match_indices("patch(") {
-                let after = &body_text[cap.0..];
-                if let Some(target) = extract_patch_target(after) {
-                    if STDLIB_MODULES.iter().any(|m| target.starts_with(m))
-                        && !targets.contains(&target)
-                    {
-                        targets.push(target);
-                    }
-                }
-            }
-        }
-
-        targets
-    }
-
-    fn detect_all_patch_targets(
-        body: Option<&tree_sitter::Node>,
-        source: &[u8],
-        decorators: &[DecoratorInfo],
-    ) -> Vec<String> {
-        let mut targets = Vec::new();
-        for dec in decorators {
-            if let Some(target) = extract_patch_target(&dec.text) {
-                if !targets.contains(&target) {
-                    targets.push(target);
-                }
-            }
-        }
-        if let Some(body_node) = body {
-            let body_text = Self::node_text(*body_node, source);
-            for cap in body_text.match_indices("patch(") {
-                let after = &body_text[cap.0..];
-                if let Some(target) = extract_patch_target(after) {
-                    if !targets.contains(&target) {
-                        targets.push(target);
-                    }
-                }
-            }
-        }
-        targets
+        patch_targets
+            .iter()
+            .filter(|t| STDLIB_MODULES.iter().any(|m| t.starts_with(m)))
+            .cloned()
+            .collect()
     }
 
-    fn detect_mock_usage(body: Option<&tree_sitter::Node>, source: &[u8]) -> (bool, usize) {
-        let body_text = body
-            .map(|b| Self::node_text(*b, source))
-            .unwrap_or_default();
+    fn detect_all_patch_targets(body_text: &str, decorators: &[DecoratorInfo]) -> Vec<String> {
+        // Keep first-seen order; the set only answers "seen before?".
+        let mut seen = HashSet::new();
+        let decorator_targets = decorators
+            .iter()
+            .filter_map(|d| extract_patch_target(d.text));
+        let body_targets = body_text
+            .match_indices("patch(")
+            .filter_map(|(i, _)| extract_patch_target(&body_text[i..]));
+        decorator_targets
+            .chain(body_targets)
+            .filter(|t| seen.insert(*t))
+            .map(str::to_string)
+            .collect()
+    }
+
+    fn detect_mock_usage(body_text: &str) -> (bool, usize) {
         let has_magic_mock = body_text.contains("MagicMock");
-        let mock_kw = [
-            "Mock(",
-            "MagicMock(",
-            "AsyncMock(",
-            "patch(",
-            ".return_value",
-            ".side_effect",
-            ".assert_called",
-            ".called",
-            ".call_count",
-            ".assert_called_once",
-            ".assert_called_with",
-            ".assert_not_called",
-        ];
-        let mut count = 0usize;
-        for kw in &mock_kw {
-            let mut start = 0;
-            while let Some(pos) = body_text[start..].find(kw) {
-                count += 1;
-                start += pos + kw.len();
-            }
-        }
+        let count = MOCK_KEYWORDS
+            .iter()
+            .map(|kw| body_text.matches(kw).count())
+            .sum();
         (has_magic_mock, count)
     }
 
-    fn detect_shutil_copy(body: Option<&tree_sitter::Node>, source: &[u8]) -> bool {
-        let body_text = body
-            .map(|b| Self::node_text(*b, source))
-            .unwrap_or_default();
+    fn detect_shutil_copy(body_text: &str) -> bool {
         body_text.contains("shutil.copy(")
             || body_text.contains("shutil.copy2(")
             || body_text.contains("shutil.copyfile(")
@@ -1763,29 +1570,40 @@ impl PythonParser {
     }
 }
 
-fn extract_patch_target(text: &str) -> Option<String> {
+/// `haystack.to_lowercase().contains(needle)` for a lowercase ASCII needle,
+/// without allocating the lowercased copy.
+fn contains_ignore_ascii_case(haystack: &str, needle: &str) -> bool {
+    let needle = needle.as_bytes();
+    haystack
+        .as_bytes()
+        .windows(needle.len())
+        .any(|w| w.eq_ignore_ascii_case(needle))
+}
+
+fn extract_patch_target(text: &str) -> Option<&str> {
     // @patch("module.path") or @patch('module.path')
     let start = text.find('(')?;
     let rest = &text[start + 1..];
     extract_first_string_arg(rest)
 }
 
-fn extract_first_string_arg(text: &str) -> Option<String> {
+fn extract_first_string_arg(text: &str) -> Option<&str> {
     let trimmed = text.trim_start();
     if trimmed.starts_with('"') {
         let end = trimmed[1..].find('"')?;
-        Some(trimmed[1..1 + end].to_string())
+        Some(&trimmed[1..1 + end])
     } else if trimmed.starts_with('\'') {
         let end = trimmed[1..].find('\'')?;
-        Some(trimmed[1..1 + end].to_string())
+        Some(&trimmed[1..1 + end])
     } else {
         None
     }
 }
 
 fn has_mock_verifications_only(body_text: &str) -> bool {
-    let mock_kw = [".assert_called", ".called", ".call_count"];
-    let has_mock = mock_kw.iter().any(|k| body_text.contains(k));
+    let has_mock = MOCK_VERIFICATION_KEYWORDS
+        .iter()
+        .any(|k| body_text.contains(k));
     let has_assert = body_text.contains("assert ") || body_text.contains("assert(");
     has_mock && !has_assert
 }
@@ -1794,6 +1612,59 @@ fn has_mock_verifications_only(body_text: &str) -> bool {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_contains_ignore_ascii_case() {
+        assert!(contains_ignore_ascii_case("session.Commit", "commit"));
+        assert!(contains_ignore_ascii_case("ROLLBACK", "rollback"));
+        assert!(!contains_ignore_ascii_case("comm", "commit"));
+    }
+
+    #[test]
+    fn test_walk_preorder_stays_within_root() {
+        let mut parser = Parser::new();
+        parser
+            .set_language(&tree_sitter_python::LANGUAGE.into())
+            .unwrap();
+        let tree = parser
+            .parse("def a():\n    x = 1\n\ndef b():\n    yield 2\n", None)
+            .unwrap();
+        let first = tree.root_node().child(0).unwrap();
+        let mut kinds_seen = Vec::new();
+        walk_preorder(first, |n| {
+            kinds_seen.push(n.kind());
+            true
+        });
+        assert_eq!(kinds_seen.first(), Some(&"function_definition"));
+        assert!(kinds_seen.contains(&"assignment"));
+        assert!(!kinds_seen.contains(&"yield"));
+
+        let mut visited = 0;
+        walk_preorder(tree.root_node(), |_| {
+            visited += 1;
+            visited < 3
+        });
+        assert_eq!(visited, 3);
+    }
+
+    #[test]
+    fn test_node_kind_ids_resolve_against_grammar() {
+        let k = kinds();
+        for id in [
+            k.assert_statement,
+            k.assignment,
+            k.call,
+            k.comparison_operator,
+            k.delete_statement,
+            k.identifier,
+            k.if_statement,
+            k.return_statement,
+            k.try_statement,
+            k.yield_expr,
+        ] {
+            assert_ne!(id, 0, "node kind missing from the Python grammar");
+        }
+    }
+
     #[test]
     fn test_parse_simple_file() {
         let dir = tempfile::tempdir().unwrap();
@@ -2249,6 +2120,21 @@ def test_bare(x):
         assert_eq!(module.test_functions[0].parametrize_count, Some(3));
     }
 
+    #[test]
+    fn test_mark_parametrize_decorator() {
+        let module = parse_source(
+            r#"
+from pytest import mark
+
+@mark.parametrize("x", [1, 2])
+def test_mark(x):
+    assert x > 0
+"#,
+        );
+        assert!(module.test_functions[0].is_parametrized);
+        assert_eq!(module.test_functions[0].parametrize_count, Some(2));
+    }
+
     #[test]
     fn test_parametrize_ast_single_element() {
         let module = parse_source(
@@ -3213,6 +3099,22 @@ def auto_fix():
         assert!(module.fixtures[0].is_autouse);
     }
 
+    #[test]
+    fn test_fixture_options_ignore_other_decorators() {
+        let module = parse_source(
+            r#"
+import pytest
+
+@pytest.mark.skipif(scope == "session", reason="autouse is True")
+@pytest.fixture
+def plain_fix():
+    return 1
+"#,
+        );
+        assert_eq!(module.fixtures[0].scope, FixtureScope::Function);
+        assert!(!module.fixtures[0].is_autouse);
+    }
+
     #[test]
     fn test_fixture_not_autouse() {
         let module = parse_source(
@@ -3283,6 +3185,25 @@ def dict_call_fix():
         assert!(module.fixtures[0].returns_mutable);
     }
 
+    #[test]
+    fn test_fixture_mutable_return_nested_in_branch() {
+        let module = parse_source(
+            r#"
+import pytest
+
+@pytest.fixture(scope="session")
+def branch_fix(request):
+    if request.param:
+        try:
+            return {"a": 1}
+        finally:
+            pass
+    return None
+"#,
+        );
+        assert!(module.fixtures[0].returns_mutable);
+    }
+
     #[test]
     fn test_fixture_immutable_return() {
         let module = parse_source(
@@ -3382,6 +3303,137 @@ def test_try():
         assert!(module.test_functions[0].has_try_except);
     }
 
+    #[test]
+    fn test_body_scan_collects_all_facts_in_one_walk() {
+        let module = parse_source(
+            r#"
+def test_everything():
+    random.seed(1)
+    if random.choice([1, 2]):
+        subprocess.run(["ls"])
+    with pytest.raises(ValueError):
+        os.chdir("/tmp")
+    assert True
+    assert requests.get("http://x.com")
+"#,
+        );
+        let t = &module.test_functions[0];
+        assert_eq!(t.assertion_count, 2);
+        assert!(t.has_conditional_logic);
+        assert!(!t.has_try_except);
+        assert!(t.uses_random);
+        assert!(t.has_random_seed);
+        assert!(t.uses_subprocess);
+        assert!(t.uses_pytest_raises);
+        assert!(t.uses_cwd_dependency);
+        assert!(t.uses_network);
+        assert!(!t.uses_time_sleep);
+        assert!(!t.uses_file_io);
+    }
+
+    #[test]
+    fn test_random_call_lines_detects_random_module_attribute() {
+        let module = parse_source("def test_r():\n    x = random.unknown_func()\n");
+        assert_eq!(
+            module.test_functions[0].random_call_lines,
+            vec![2],
+            "random.<unknown> should be detected via attribute object check"
+        );
+    }
+
+    #[test]
+    fn test_random_call_lines_detects_randint() {
+        let module = parse_source("def test_r():\n    x = 1\n    y = random.randint(1, 10)\n");
+        assert_eq!(module.test_functions[0].random_call_lines, vec![3]);
+    }
+
+    #[test]
+    fn test_random_call_lines_no_false_positive() {
+        let module = parse_source("def test_r():\n    x = deterministic_func()\n");
+        assert!(module.test_functions[0].random_call_lines.is_empty());
+    }
+
+    #[test]
+    fn test_random_call_lines_no_false_positive_attribute() {
+        let module = parse_source("def test_r():\n    x = math.sqrt(4)\n");
+        assert!(
+            module.test_functions[0].random_call_lines.is_empty(),
+            "math.sqrt (non-random attribute) should not be detected as random"
+        );
+    }
+
+    #[test]
+    fn test_unguarded_subprocess_lines_detects_subprocess_attribute() {
+        let module = parse_source("def test_s():\n    r = subprocess.unknown_func()\n");
+        assert_eq!(
+            module.test_functions[0].unguarded_subprocess_lines,
+            vec![2],
+            "subprocess.<unknown> should be detected via attribute object check"
+        );
+    }
+
+    #[test]
+    fn test_unguarded_subprocess_lines_detects_run() {
+        let module = parse_source("def test_s():\n    r = subprocess.run(['ls'])\n");
+        assert_eq!(module.test_functions[0].unguarded_subprocess_lines, vec![2]);
+    }
+
+    #[test]
+    fn test_unguarded_subprocess_lines_skip_timeout_keyword() {
+        let module =
+            parse_source("def test_s():\n    r = subprocess.run(['echo', 'hello'], timeout=30)\n");
+        let t = &module.test_functions[0];
+        assert!(t.uses_subprocess);
+        assert!(
+            t.unguarded_subprocess_lines.is_empty(),
+            "subprocess.run with timeout=30 is guarded"
+        );
+    }
+
+    #[test]
+    fn test_unguarded_subprocess_lines_no_false_positive_attribute() {
+        let module = parse_source("def test_s():\n    r = os.system('ls')\n");
+        assert!(
+            module.test_functions[0]
+                .unguarded_subprocess_lines
+                .is_empty(),
+            "os.system (non-subprocess attribute) should not be detected as subprocess"
+        );
+    }
+
+    #[test]
+    fn test_unguarded_subprocess_lines_no_false_positive() {
+        let module = parse_source("def test_s():\n    x = other_func()\n");
+        assert!(module.test_functions[0]
+            .unguarded_subprocess_lines
+            .is_empty());
+    }
+
+    #[test]
+    fn test_fixture_body_scan_collects_all_facts_in_one_walk() {
+        let module = parse_source(
+            r#"
+import pytest
+
+@pytest.fixture
+def db():
+    conn = connect()
+    with open("seed.sql") as f:
+        conn.execute(f.read())
+    conn.commit()
+    yield conn
+    conn.rollback()
+"#,
+        );
+        let f = &module.fixtures[0];
+        assert!(f.has_yield);
+        assert!(f.has_db_commit);
+        assert!(f.has_db_rollback);
+        assert!(f.has_cleanup);
+        assert!(f.uses_file_io);
+        assert!(!f.returns_mutable);
+    }
+
     #[test]
     fn test_random_not_detected_without_random() {
         let module = parse_source(
@@ -3651,6 +3703,19 @@ def test_no_network():
         assert!(!module.test_functions[0].uses_network);
     }
 
+    #[test]
+    fn test_network_not_detected_for_lib_name_prefix() {
+        let module = parse_source(
+            r#"
+import requests_toolbelt
+def test_toolbelt():
+    requests_toolbelt.get("http://x.com")
+    assert True
+"#,
+        );
+        assert!(!module.test_functions[0].uses_network);
+    }
+
     #[test]
     fn test_fixture_deps_exclude_self_cls() {
         let module = parse_source(
@@ -4365,13 +4430,13 @@ def fix_try_no_yield():
     #[test]
     fn test_extract_patch_target_double_quotes() {
         let result = extract_patch_target(r#"@patch("subprocess.run")"#);
-        assert_eq!(result, Some("subprocess.run".to_string()));
+        assert_eq!(result, Some("subprocess.run"));
     }
 
     #[test]
     fn test_extract_patch_target_single_quotes() {
         let result = extract_patch_target(r#"@patch('os.path.exists')"#);
-        assert_eq!(result, Some("os.path.exists".to_string()));
+        assert_eq!(result, Some("os.path.exists"));
     }
 
     #[test]
@@ -4386,18 +4451,35 @@ def fix_try_no_yield():
         assert_eq!(result, None);
     }
 
+    #[test]
+    fn test_patch_targets_deduplicated_in_first_seen_order() {
+        let module = parse_source(
+            r#"
+@patch("os.path.exists")
+def test_patched(mock_exists):
+    with patch("subprocess.run"):
+        with patch("os.path.exists"):
+            assert run()
+"#,
+        );
+        assert_eq!(
+            module.test_functions[0].patch_targets,
+            vec!["os.path.exists".to_string(), "subprocess.run".to_string()]
+        );
+    }
+
     // ── extract_first_string_arg unit tests ──
 
     #[test]
     fn test_extract_first_string_arg_double_quotes() {
         let result = extract_first_string_arg(r#""socket.socket")"#);
-        assert_eq!(result, Some("socket.socket".to_string()));
+        assert_eq!(result, Some("socket.socket"));
     }
 
     #[test]
     fn test_extract_first_string_arg_single_quotes() {
         let result = extract_first_string_arg("'builtins.open')");
-        assert_eq!(result, Some("builtins.open".to_string()));
+        assert_eq!(result, Some("builtins.open"));
     }
 
     #[test]
@@ -4409,7 +4491,7 @@ def fix_try_no_yield():
     #[test]
     fn test_extract_first_string_arg_empty_string() {
         let result = extract_first_string_arg(r#"""")"#);
-        assert_eq!(result, Some(String::new()));
+        assert_eq!(result, Some(""));
     }
 
     // ── detect_stdlib_mock_targets unit tests ──
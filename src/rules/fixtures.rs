@@ -6,6 +6,22 @@ use crate::engine::{fixture_scope_by_name, make_violation};
 use crate::models::{Category, Fixture, FixtureScope, ParsedModule, Severity, Violation};
 use crate::rules::{Rule, RuleContext};
 
+/// Builtins and pytest-provided names a fixture should not reuse.
+const SHADOWED_NAMES: &[&str] = &[
+    "list",
+    "dict",
+    "set",
+    "id",
+    "type",
+    "input",
+    "open",
+    "tmp_path",
+    "capsys",
+    "monkeypatch",
+    "request",
+    "fixture",
+];
+
 /// Rule that detects autouse fixtures which implicitly affect all tests.
 pub struct AutouseFixtureRule;
 
@@ -73,6 +89,11 @@ impl Rule for InvalidScopeRule {
         let mut violations = Vec::new();
 
         for fixture in &module.fixtures {
+            // Function is the narrowest scope, so it can never exceed a
+            // dependency's; skip the per-dependency lookups.
+            if fixture.scope == FixtureScope::Function {
+                continue;
+            }
             for dep_name in &fixture.dependencies {
                 if let Some(dep_scope) = fixture_scope_by_name(ctx.fixture_map, dep_name) {
                     if fixture.scope > dep_scope {
@@ -126,24 +147,22 @@ impl Rule for ShadowedFixtureRule {
         let mut violations = Vec::new();
 
         for fixture in &module.fixtures {
-            if let Some(locations) = ctx.fixture_locations.get(&fixture.name) {
-                if locations.len() > 1 {
-                    violations.push(make_violation(
-                        self.id(),
-                        self.name(),
-                        self.severity(),
-                        self.category(),
-                        format!(
-                            "Fixture '{}' is defined in {} different modules (shadowed)",
-                            fixture.name,
-                            locations.len()
-                        ),
-                        module.file_path.clone(),
-                        fixture.line,
-                        Some("Rename or consolidate fixture definitions".to_string()),
-                        None,
-                    ));
-                }
+            if let Some(locations) = ctx.fixture_locations.get(fixture.name.as_str()) {
+                violations.push(make_violation(
+                    self.id(),
+                    self.name(),
+                    self.severity(),
+                    self.category(),
+                    format!(
+                        "Fixture '{}' is defined in {} different modules (shadowed)",
+                        fixture.name,
+                        locations.len()
+                    ),
+                    module.file_path.clone(),
+                    fixture.line,
+                    Some("Rename or consolidate fixture definitions".to_string()),
+                    None,
+                ));
             }
         }
         violations
@@ -177,7 +196,7 @@ impl Rule for UnusedFixtureRule {
             if fixture.is_autouse {
                 continue;
             }
-            if !ctx.used_fixture_names.contains(&fixture.name) {
+            if !ctx.used_fixture_names.contains(fixture.name.as_str()) {
                 violations.push(make_violation(
                     self.id(),
                     self.name(),
@@ -267,7 +286,7 @@ impl Rule for FixtureMutationRule {
             for dep_name in &test.mutates_fixture_deps {
                 let is_mutable_fixture = ctx
                     .fixture_map
-                    .get(dep_name)
+                    .get(dep_name.as_str())
                     .is_some_and(|fixtures| fixtures.iter().any(|f| f.returns_mutable));
                 if is_mutable_fixture {
                     violations.push(make_violation(
@@ -436,23 +455,24 @@ impl Rule for AutouseCascadeDepthRule {
     }
 }
 
-fn compute_cascade_depth(
-    fixture: &Fixture,
-    fixture_map: &HashMap<String, Vec<&Fixture>>,
-    visited: &mut HashSet<String>,
+fn compute_cascade_depth<'a>(
+    fixture: &'a Fixture,
+    fixture_map: &HashMap<&str, Vec<&'a Fixture>>,
+    visited: &mut HashSet<&'a str>,
 ) -> usize {
-    if visited.contains(&fixture.name) {
+    // `visited` holds the current path only, so names are borrowed rather
+    // than cloned on every step of the recursion.
+    if !visited.insert(fixture.name.as_str()) {
         return 0;
     }
-    visited.insert(fixture.name.clone());
-    let deps = fixture.dependencies.clone();
+    let deps = &fixture.dependencies;
     let result = if deps.is_empty() {
         1
     } else {
         deps.iter()
             .map(|dep| {
                 fixture_map
-                    .get(dep)
+                    .get(dep.as_str())
                     .and_then(|v| {
                         v.iter()
                             .find(|f| f.file_path == fixture.file_path || v.len() == 1)
@@ -465,7 +485,7 @@ fn compute_cascade_depth(
             .unwrap_or(0)
             + 1
     };
-    visited.remove(&fixture.name);
+    visited.remove(fixture.name.as_str());
     result
 }
 
@@ -493,7 +513,7 @@ impl Rule for ModuleScopeFixtureMutatedRule {
         let mut violations = Vec::new();
         for test in &module.test_functions {
             for dep in &test.mutates_fixture_deps {
-                let is_broad_scoped = ctx.fixture_map.get(dep).is_some_and(|fixtures| {
+                let is_broad_scoped = ctx.fixture_map.get(dep.as_str()).is_some_and(|fixtures| {
                     fixtures
                         .iter()
                         .find(|f| f.file_path == module.file_path)
@@ -594,22 +614,8 @@ impl Rule for FixtureNameShadowsBuiltinRule {
         _ctx: &RuleContext,
     ) -> Vec<Violation> {
         let mut violations = Vec::new();
-        let shadows = [
-            "list",
-            "dict",
-            "set",
-            "id",
-            "type",
-            "input",
-            "open",
-            "tmp_path",
-            "capsys",
-            "monkeypatch",
-            "request",
-            "fixture",
-        ];
         for fixture in &module.fixtures {
-            if shadows.contains(&fixture.name.as_str()) {
+            if SHADOWED_NAMES.contains(&fixture.name.as_str()) {
                 violations.push(make_violation(
                     self.id(),
                     self.name(),
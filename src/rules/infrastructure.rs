@@ -1,9 +1,14 @@
 use crate::engine::make_violation;
 use crate::models::{Category, ParsedModule, Severity, Violation};
-use crate::rules::{Rule, RuleContext};
+use crate::rules::{imports_mock_layer, Rule, RuleContext, HTTP_MOCK_LAYER_LIBS, NETWORK_MODULES};
 
-const NETWORK_MODULES: &[&str] = &[
-    "requests", "httpx", "aiohttp", "urllib", "urllib3", "socket", "pycurl", "grpc", "aiogrpc",
+/// `monkeypatch` calls whose effects outlive the statement unless scoped.
+const MONKEYPATCH_CALLS: &[&str] = &[
+    "monkeypatch.setattr(",
+    "monkeypatch.setenv(",
+    "monkeypatch.delenv(",
+    "monkeypatch.chdir(",
+    "monkeypatch.syspath_prepend(",
 ];
 
 pub struct NetworkBanMissingRule;
@@ -34,28 +39,12 @@ impl Rule for NetworkBanMissingRule {
         if !has_network {
             return vec![];
         }
-        let has_network_mark = module.source.contains("@pytest.mark.network")
-            || module.source.contains("pytest.mark.network");
-        let is_conftest = module.file_path.ends_with("conftest.py");
-        if has_network_mark || is_conftest {
+        // The file-name and import checks are cheap; the whole-source marker
+        // scan only runs for files that would otherwise be reported.
+        if module.file_path.ends_with("conftest.py") {
             return vec![];
         }
-        let mock_layer_libs = [
-            "pytest_httpx",
-            "respx",
-            "aioresponses",
-            "responses",
-            "requests_mock",
-            "pytest_mock",
-            "vcrpy",
-            "betamax",
-            "httmock",
-        ];
-        let has_mock_layer = module
-            .imports
-            .iter()
-            .any(|imp| mock_layer_libs.iter().any(|ml| imp.contains(ml)));
-        if has_network_mark || has_mock_layer {
+        if imports_mock_layer(module) || module.source.contains("pytest.mark.network") {
             return vec![];
         }
         vec![make_violation(
@@ -102,41 +91,32 @@ impl Rule for LiveSuiteUnmarkedRule {
         if !has_network {
             return vec![];
         }
-        let mock_layer_libs = [
-            "pytest_httpx",
-            "respx",
-            "aioresponses",
-            "responses",
-            "requests_mock",
-            "vcrpy",
-            "betamax",
-            "httmock",
-        ];
         let has_mock_layer = module
             .imports
             .iter()
-            .any(|imp| mock_layer_libs.iter().any(|ml| imp.contains(ml)));
+            .any(|imp| HTTP_MOCK_LAYER_LIBS.iter().any(|ml| imp.contains(ml)));
         if has_mock_layer {
             return vec![];
         }
-        for test in &module.test_functions {
-            if test.uses_network {
-                let has_live = module.source.contains("@pytest.mark.live")
-                    || module.source.contains("pytest.mark.live");
-                if !has_live {
-                    return vec![make_violation(
-                        self.id(),
-                        self.name(),
-                        self.severity(),
-                        self.category(),
-                        "File has live network calls without @pytest.mark.live".to_string(),
-                        module.file_path.clone(),
-                        1,
-                        Some("Mark live network tests with @pytest.mark.live for selective CI filtering".to_string()),
-                        None,
-                    )];
-                }
-            }
+        // The live marker is a property of the file, so it is checked once
+        // rather than per network-using test.
+        if module.test_functions.iter().any(|t| t.uses_network)
+            && !module.source.contains("pytest.mark.live")
+        {
+            return vec![make_violation(
+                self.id(),
+                self.name(),
+                self.severity(),
+                self.category(),
+                "File has live network calls without @pytest.mark.live".to_string(),
+                module.file_path.clone(),
+                1,
+                Some(
+                    "Mark live network tests with @pytest.mark.live for selective CI filtering"
+                        .to_string(),
+                ),
+                None,
+            )];
         }
         vec![]
     }
@@ -174,15 +154,7 @@ impl Rule for NonIdiomaticMonkeyPatchRule {
                     .copied()
                     .collect::<Vec<&str>>()
                     .join("\n");
-                let non_idiomatic_patterns = [
-                    "monkeypatch.setattr(",
-                    "monkeypatch.setenv(",
-                    "monkeypatch.delenv(",
-                    "monkeypatch.chdir(",
-                    "monkeypatch.syspath_prepend(",
-                ];
-                let has_monkeypatch_call =
-                    non_idiomatic_patterns.iter().any(|p| test_body.contains(p));
+                let has_monkeypatch_call = MONKEYPATCH_CALLS.iter().any(|p| test_body.contains(p));
                 if has_monkeypatch_call {
                     let has_context = test_body.contains("with monkeypatch.context()")
                         || test_body.contains("monkeypatch.undo()");
@@ -14,6 +14,20 @@ fn stable_hash(content: &str) -> u64 {
     hasher.finish()
 }
 
+/// Case-insensitive search for "given", "when" or "then" in a single pass,
+/// without lowercasing a copy of the text.
+fn has_gherkin_keyword(text: &str) -> bool {
+    const KEYWORDS: [&[u8]; 3] = [b"given", b"when", b"then"];
+    let bytes = text.as_bytes();
+    (0..bytes.len()).any(|i| {
+        KEYWORDS.iter().any(|kw| {
+            bytes
+                .get(i..i + kw.len())
+                .is_some_and(|w| w.eq_ignore_ascii_case(kw))
+        })
+    })
+}
+
 /// Rule that detects conditional logic inside test functions.
 pub struct TestLogicRule;
 
@@ -396,10 +410,10 @@ impl Rule for BddMissingScenarioRule {
             if test.is_parametrized {
                 continue;
             }
-            let has_gherkin = test.docstring.as_ref().is_some_and(|ds| {
-                let lower = ds.to_lowercase();
-                lower.contains("given") || lower.contains("when") || lower.contains("then")
-            });
+            let has_gherkin = test
+                .docstring
+                .as_ref()
+                .is_some_and(|ds| has_gherkin_keyword(ds));
             if !has_gherkin {
                 violations.push(make_violation(
                     self.id(),
@@ -542,17 +556,21 @@ impl Rule for ParametrizeDuplicateRule {
         _ctx: &RuleContext,
     ) -> Vec<Violation> {
         let mut violations = Vec::new();
+        // One occurrence table is reused for every values list in the module,
+        // so large parametrize sets are counted without reallocating.
+        let mut counts: std::collections::HashMap<&str, usize> = std::collections::HashMap::new();
         for test in &module.test_functions {
             for values in &test.parametrize_values {
-                let mut seen = std::collections::HashSet::new();
-                let mut duplicates = std::collections::HashSet::new();
+                counts.clear();
                 for val in values {
-                    if !seen.insert(val) {
-                        duplicates.insert(val.as_str());
-                    }
+                    *counts.entry(val.as_str()).or_insert(0) += 1;
                 }
-                if !duplicates.is_empty() {
-                    let mut dup_str: Vec<&str> = duplicates.into_iter().collect();
+                let mut dup_str: Vec<&str> = counts
+                    .iter()
+                    .filter(|(_, &n)| n > 1)
+                    .map(|(&val, _)| val)
+                    .collect();
+                if !dup_str.is_empty() {
                     dup_str.sort_unstable();
                     violations.push(make_violation(
                         self.id(),
@@ -852,7 +870,7 @@ impl Rule for InlineSchemaRedeclaredRule {
         if tests.len() < 2 {
             return violations;
         }
-        let mut schema_hashes: HashMap<u64, Vec<String>> = HashMap::new();
+        let mut schema_hashes: HashMap<u64, Vec<&str>> = HashMap::new();
         let source_lines: Vec<&str> = source.lines().collect();
         for test in tests {
             let start = test.line.saturating_sub(1);
@@ -881,19 +899,14 @@ impl Rule for InlineSchemaRedeclaredRule {
                 };
                 if let Some(content) = dict_content {
                     let hash = stable_hash(&content);
-                    schema_hashes
-                        .entry(hash)
-                        .or_default()
-                        .push(test.name.clone());
+                    schema_hashes.entry(hash).or_default().push(&test.name);
                 }
             }
         }
-        let mut reported = std::collections::HashSet::new();
-        for (hash, names) in &schema_hashes {
-            if names.len() >= 2 && !reported.contains(hash) {
-                reported.insert(*hash);
-                let unique_names: std::collections::HashSet<&str> =
-                    names.iter().map(|n| n.as_str()).collect();
+        // Each hash is a distinct map key, so every group is visited once.
+        for names in schema_hashes.values() {
+            if names.len() >= 2 {
+                let unique_names: std::collections::HashSet<&str> = names.iter().copied().collect();
                 if unique_names.len() >= 2 {
                     let test_names: Vec<&str> = unique_names.into_iter().collect();
                     violations.push(make_violation(
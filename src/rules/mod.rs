@@ -1,13 +1,48 @@
 use crate::models::{Fixture, ParsedModule, Violation};
 use std::collections::{HashMap, HashSet};
-use std::path::PathBuf;
+use std::path::Path;
+
+/// Modules whose import marks a file as talking to the network.
+pub(crate) const NETWORK_MODULES: &[&str] = &[
+    "requests",
+    "socket",
+    "httpx",
+    "aiohttp",
+    "urllib",
+    "urllib3",
+    "pycurl",
+    "tornado.httpclient",
+    "grpc",
+    "aiogrpc",
+];
+
+/// Libraries that stand in for a live HTTP service.
+pub(crate) const HTTP_MOCK_LAYER_LIBS: &[&str] = &[
+    "pytest_httpx",
+    "respx",
+    "aioresponses",
+    "responses",
+    "requests_mock",
+    "vcrpy",
+    "betamax",
+    "httmock",
+];
+
+/// Whether `module` imports a library that intercepts network calls. Besides
+/// the HTTP mock layers this accepts `pytest_mock`, which can patch the client
+/// away but does not stand in for a live service.
+pub(crate) fn imports_mock_layer(module: &ParsedModule) -> bool {
+    module.imports.iter().any(|imp| {
+        imp.contains("pytest_mock") || HTTP_MOCK_LAYER_LIBS.iter().any(|ml| imp.contains(ml))
+    })
+}
 
 /// Context passed to each rule containing cross-module fixture information.
 pub struct RuleContext<'a> {
-    pub fixture_map: &'a HashMap<String, Vec<&'a Fixture>>,
-    pub used_fixture_names: &'a HashSet<String>,
-    pub fixture_locations: &'a HashMap<String, Vec<PathBuf>>,
-    pub session_mutable_fixtures: &'a HashSet<String>,
+    pub fixture_map: &'a HashMap<&'a str, Vec<&'a Fixture>>,
+    pub used_fixture_names: &'a HashSet<&'a str>,
+    pub fixture_locations: &'a HashMap<&'a str, Vec<&'a Path>>,
+    pub session_mutable_fixtures: &'a HashSet<&'a str>,
 }
 
 /// Trait implemented by all lint rules.
@@ -136,4 +171,17 @@ mod tests {
             assert!(ids.contains(id), "Expected rule {} to be present", id);
         }
     }
+
+    #[test]
+    fn test_pytest_mock_is_a_mock_layer_but_not_an_http_one() {
+        let module = ParsedModule {
+            file_path: Path::new("test_api.py").to_path_buf(),
+            source: String::new(),
+            imports: vec!["import pytest_mock".to_string()],
+            test_functions: vec![],
+            fixtures: vec![],
+        };
+        assert!(imports_mock_layer(&module));
+        assert!(!HTTP_MOCK_LAYER_LIBS.contains(&"pytest_mock"));
+    }
 }
@@ -2239,6 +2239,23 @@ def test_with_when():
     assert!(v.is_none());
 }
 
+#[test]
+fn test_bdd_with_uppercase_keyword_does_not_trigger_bdd001() {
+    let dir = tempfile::tempdir().unwrap();
+    let path = write_temp_file(
+        dir.path(),
+        "test_bdd_upper.py",
+        r#"
+def test_with_upper():
+    """GIVEN a user, WHEN they log in, THEN they see the dashboard."""
+    assert True
+"#,
+    );
+    let violations = lint_single_file(&path);
+    let v = find_violation(&violations, "PYTEST-BDD-001");
+    assert!(v.is_none());
+}
+
 #[test]
 fn test_bdd_with_then_does_not_trigger_bdd001() {
     let dir = tempfile::tempdir().unwrap();
@@ -2570,8 +2587,8 @@ def test_thing(fix_b):
     assert fix_b == 2
 "#,
     );
-    let module = parse_file(&path);
-    let used = compute_used_fixture_names(&[module]);
+    let modules = [parse_file(&path)];
+    let used = compute_used_fixture_names(&modules);
     assert!(used.contains("fix_b"));
     assert!(used.contains("fix_a"));
 }
@@ -3998,6 +4015,78 @@ fn test_save_baseline_empty_violations() {
     assert_eq!(content.trim(), "[]");
 }
 
+#[test]
+fn test_save_baseline_replaces_existing_file() {
+    let dir = tempfile::tempdir().unwrap();
+    let baseline_path = dir.path().join("baseline.json");
+    std::fs::write(&baseline_path, "stale contents that are longer than []").unwrap();
+
+    pytest_linter::engine::save_baseline(&[], &baseline_path).unwrap();
+    let content = std::fs::read_to_string(&baseline_path).unwrap();
+    assert_eq!(content.trim(), "[]");
+    assert!(!dir.path().join("baseline.json.tmp").exists());
+}
+
+#[test]
+fn test_parse_cache_reuses_conftest_between_runs() {
+    let dir = tempfile::tempdir().unwrap();
+    write_temp_file(
+        dir.path(),
+        "conftest.py",
+        r#"
+import pytest
+
+@pytest.fixture(scope="session")
+def shared_state():
+    return {"items": []}
+"#,
+    );
+    write_temp_file(
+        dir.path(),
+        "test_uses_state.py",
+        r#"
+def test_append(shared_state):
+    shared_state["items"].append(1)
+    assert shared_state["items"]
+"#,
+    );
+    let cache_path = dir.path().join("parse-cache.json");
+    let config = Config {
+        cache: Some(cache_path.clone()),
+        ..Config::default()
+    };
+    let engine = LintEngine::new(config).unwrap();
+    let paths = [dir.path().to_path_buf()];
+
+    let cold = engine.lint_paths(&paths).unwrap();
+    assert!(cache_path.exists());
+    assert!(cold.iter().any(|v| v.rule_id == "PYTEST-FIX-007"));
+
+    // Rename the fixture without changing the file's size or mtime: a fresh
+    // parse no longer links the test's mutation to `shared_state`, so only a
+    // cache hit keeps FIX-007.
+    let conftest = dir.path().join("conftest.py");
+    let modified = std::fs::metadata(&conftest).unwrap().modified().unwrap();
+    let renamed = std::fs::read_to_string(&conftest)
+        .unwrap()
+        .replace("shared_state", "shared_stash");
+    std::fs::write(&conftest, renamed).unwrap();
+    std::fs::File::options()
+        .write(true)
+        .open(&conftest)
+        .unwrap()
+        .set_modified(modified)
+        .unwrap();
+
+    let uncached = LintEngine::new(Config::default())
+        .unwrap()
+        .lint_paths(&paths)
+        .unwrap();
+    assert!(!uncached.iter().any(|v| v.rule_id == "PYTEST-FIX-007"));
+    let warm = engine.lint_paths(&paths).unwrap();
+    assert_eq!(cold, warm);
+}
+
 #[test]
 fn test_collect_violations_function() {
     let dir = tempfile::tempdir().unwrap();
@@ -4241,6 +4330,24 @@ def test_random_value():
     assert!(v.message.contains("random"));
 }
 
+#[test]
+fn test_random_call_lines_come_from_linted_source_not_disk() {
+    let engine = LintEngine::new(Config::default()).unwrap();
+    let source = r#"
+import random
+
+def test_random_value():
+    x = 1
+    val = random.randint(1, 100)
+    assert val > x
+"#;
+    let violations = engine
+        .lint_source(source, Path::new("does_not_exist/test_unsaved.py"))
+        .unwrap();
+    let v = find_violation(&violations, "PYTEST-FLK-008");
+    assert_eq!(v.map(|v| v.line), Some(6));
+}
+
 #[test]
 fn test_random_with_seed_does_not_trigger_flk008() {
     let dir = tempfile::tempdir().unwrap();